@@ -1,67 +1,85 @@
 from moonclock_board import MoonClock
 from tcv_astro.angles import hours_to_hms
 from tcv_astro import moon
-from tcv_astro.polynomial import linear_interp_in_parts
-from tcv_astro import julian, polynomial
-from tcv_astro.event_times import get_event_time, get_sun_positions_for_event, get_moon_positions_for_event, RiseTransitSetTimes
+from tcv_astro.polynomial import linear_interp_xy
+from tcv_astro import julian
+from tcv_astro.event_times import get_event_time, get_sun_positions_window, get_moon_positions_window, PositionsWindow, RiseTransitSetTimes
 from adafruit_datetime import datetime, timedelta
 from adafruit_max7219.matrices import CustomMatrix
 
 import time
+from array import array
 # Give us a chance to run GC on circuitpython
 try:
     import gc
-    def run_gc():
-        gc.collect()
+    run_gc = gc.collect
 except:
     def run_gc():
         pass
 
 try:
     import machine
-    def reboot():
-        machine.reset()
+    reboot = machine.reset
 except:
     def reboot():
         pass
 
-CHANNEL_MOON_PHASE = 0
-CHANNEL_MOONLESS_HOURS = 1
+# const() lets the bytecode compiler inline these as immediates instead of global lookups.
+try:
+    from micropython import const
+except ImportError:
+    def const(x):
+        return x
+
+CHANNEL_MOON_PHASE = const(0)
+CHANNEL_MOONLESS_HOURS = const(1)
+
+NUM_SECONDS_TO_RESET_DISPLAY = const(127)
 
-NUM_SECONDS_TO_RESET_DISPLAY = 127
+LUNAR_PHASE_UPDATE_PERIOD_SECONDS = 10.0
+# Mean rate of the 28-day normalized lunar age, in normalized days per day.
+LUNAR_AGE_NORMALIZED_RATE = 28.0 / 29.530575
+
+_SUNDAY = const(6)
+_MARCH = const(3)
+_NOVEMBER = const(11)
+_DST_SECONDS = const(3600)
+
+MAIN_LOOP_PERIOD_SECONDS = 0.02
+
+# Set to True to force a GC and print free memory between the steps of the daily astro computations.
+DEBUG_GC = False
+# Set to True to print the daily rise/set and moonless hours computation details.
+VERBOSE_DAILY = False
 
 def debug_print(*args):
   print(*args)
 
+def debug_gc():
+  if DEBUG_GC:
+    run_gc()
+    print(gc.mem_free())
+
 def pt(l, t):
   debug_print("{} {:02}/{:02} {:02}:{:02}".format(l, t.month, t.day, t.hour, t.minute))
 
+def _write2(buf: bytearray, offset: int, value: int):
+  """Write `value` (0..99) as two ASCII digits into `buf` at `offset`."""
+  buf[offset] = 0x30 + (value // 10)
+  buf[offset + 1] = 0x30 + (value % 10)
+
+
+# Phase dial DAC counts sampled every 0.1 day over the 0..28 day normalized lunar age.
+# Values for REV1 PCB: 631.26 + 125.6 * days - 0.768 * days^2, in Horner form
+# Values for prototype breadboard: (((-6.444e-01 * days) + 1.174e+02) * days) + 5.046e+02
+_PHASE_LUT_STEPS_PER_DAY = const(10)
+_PHASE_LUT_LAST_IDX = const(280)
+PHASE_DIAL_LUT = array("H", [int((((-0.768 * days) + 125.6) * days) + 631.26) for days in (idx / _PHASE_LUT_STEPS_PER_DAY for idx in range(_PHASE_LUT_LAST_IDX + 1))])
+
+# Moonless hours -> DAC counts calibration for the moonless-hours dial, as parallel x/y arrays
+MOONLESS_HOURS_X = array("f", [0.0, 0.25, 0.5, 1.0, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0, 3.25, 3.5, 3.75, 4.0, 4.25, 4.5])
+MOONLESS_HOURS_Y = array("H", [410, 610, 800, 1000, 1180, 1380, 1570, 1775, 1965, 2160, 2355, 2560, 2750, 2950, 3150, 3355, 3555])
 
-MOONLESS_HOURS_POINTS = [
-  (0, 410),
-  (0.25, 610),
-  (0.5, 800),
-  (1.0, 1000),
-  (1.5, 1180),
-  (1.75, 1380),
-  (2.0, 1570),
-  (2.25, 1775),
-  (2.5, 1965),
-  (2.75, 2160),
-  (3.0, 2355),
-  (3.25, 2560),
-  (3.5, 2750),
-  (3.75, 2950),
-  (4.0, 3150),
-  (4.25, 3355),
-  (4.5, 3555),
-]
-
-
-class RiseSetEvent:
-  def __init__(self, moment: datetime, is_rise: bool):
-    self.moment: datetime = moment
-    self.is_rise: bool = is_rise
 
 class RiseSetTimes:
   def __init__(self, rise_time: datetime, set_time: datetime):
@@ -70,19 +88,31 @@ class RiseSetTimes:
 
 
 def get_date_of_nth_weekday_of_month(year: int, month: int, weekday: int, num: int) -> int:
-  date_iter = datetime(year, month, 1, 0, 0, 0)
-  cur_num = 0
+  """Return the day of month of the `num`th `weekday` (Monday=0) of a month, without any datetime math."""
+  # Zeller's congruence for the 1st of the month, with January/February as months 13/14 of previous year.
+  m = month
+  y = year
+  if m < 3:
+    m += 12
+    y -= 1
+  h = (1 + ((13 * (m + 1)) // 5) + y + (y // 4) - (y // 100) + (y // 400)) % 7
+  # Zeller gives Saturday=0, convert to Monday=0
+  first_weekday = (h + 5) % 7
 
-  while date_iter.month == month:
-    if date_iter.weekday() == weekday:
-      cur_num += 1
+  day = 1 + ((weekday - first_weekday) % 7) + (7 * (num - 1))
 
-    if cur_num == num:
-      return date_iter.day
+  if month == 2:
+    is_leap = (year % 4 == 0) and ((year % 100 != 0) or (year % 400 == 0))
+    days_in_month = 29 if is_leap else 28
+  elif month in (4, 6, 9, 11):
+    days_in_month = 30
+  else:
+    days_in_month = 31
 
-    date_iter += timedelta(days=1)
+  if num < 1 or day > days_in_month:
+    raise ValueError("Never found the correct day")
 
-  raise ValueError("Never found the correct day")
+  return day
 
 
 class MoonClockSettings:
@@ -96,52 +126,49 @@ class MoonClockSettings:
     }
     self.is_test_mode = False
 
+    # UTC offset derived from settings_dict, kept up to date by _update_utc_offset().
+    self._utc_offset_seconds: int = 0
+    self._utc_offset: timedelta = timedelta(0)
+    self._update_utc_offset()
+
+    # Observer position in degrees derived from settings_dict, kept up to date by _update_observer_position().
+    self._obs_lat_degrees: float = 0.0
+    self._obs_lon_degrees: float = 0.0
+    self._update_observer_position()
+
+    # DST transition days only change once a year, so cache them by year.
+    self._dst_cache_year = None
+    self._dst_anchors = (0, 0)
+    # Single-slot cache of the last get_dst_seconds() result, keyed by local standard hour.
+    self._dst_cache_key = -1
+    self._dst_cache_seconds = 0
+
+    # Last RTC reading and its matching local time, see get_local_time().
+    self._last_rtc_key = None
+    self._last_local_time: time.struct_time = None
+    # Local (year, month, day) of _last_local_time packed in an int, see local_day_key.
+    self._local_day_key: int = 0
+
+    # SysEx command token -> handler(tokens) returning whether settings need saving.
+    self._sysex_handlers = {
+      "UTC": self._sysex_set_utc,
+      "DATE": self._sysex_set_date,
+      "OFFSET": self._sysex_set_offset,
+      "DST": self._sysex_set_dst,
+      "POS": self._sysex_set_pos,
+      "STOPCAL": self._sysex_stop_cal,
+      "CAL": self._sysex_cal,
+    }
+
   def process_sysex_setting(self, setting: str):
     debug_print("Got SysEx setting command: ", setting)
     tokens = setting.split(',')
     need_save: bool = False
 
     try:
-      if tokens[0] == "UTC":
-        hours = int(tokens[1])
-        minutes = int(tokens[2])
-        seconds = int(tokens[3])
-
-        current_time = self.moon_clock.rtc.datetime
-        new_time = time.struct_time((current_time.tm_year, current_time.tm_mon, current_time.tm_mday, hours, minutes, seconds, current_time.tm_wday, -1, -1))
-        self.moon_clock.rtc.datetime = new_time
-      elif tokens[0] == "DATE":
-        year = int(tokens[1])
-        month = int(tokens[2])
-        day = int(tokens[3])
-        dow = int(tokens[4])
-
-        current_time = self.moon_clock.rtc.datetime
-        new_time = time.struct_time((year, month, day, current_time.tm_hour, current_time.tm_min, current_time.tm_sec, dow, -1, -1))
-        self.moon_clock.rtc.datetime = new_time
-      elif tokens[0] == "OFFSET":
-        self.settings_dict["utc_offset_seconds"] = int(tokens[1])
-        need_save = True
-      elif tokens[0] == "DST":
-        self.settings_dict["dst_strategy"] = tokens[1]
-        need_save = True
-      elif tokens[0] == "POS":
-        self.settings_dict["latitude_millionths"] = int(tokens[1])
-        self.settings_dict["longitude_millionths"] = int(tokens[2])
-        need_save = True
-      elif tokens[0] == "STOPCAL":
-        self.is_test_mode = False
-      elif tokens[0] == "CAL":
-        self.is_test_mode = True
-        channel = int(tokens[1]) % 2
-        value = int(tokens[2]) % 4096
-        # Enter interactive calibration mode with value 4095, otherwise just push value to DAC from sysex.
-        if value < 4095:
-          self.moon_clock.dac_driver.load_dac_value(channel, value)
-          self.moon_clock.dac_driver.latch_dacs()
-        else:
-          self.run_interactive_cal(channel)
-
+      handler = self._sysex_handlers.get(tokens[0])
+      if handler is not None:
+        need_save = handler(tokens)
     except Exception as e:
       debug_print('Error processing sysex "%s": %s' % (setting, e))
       return
@@ -149,6 +176,59 @@ class MoonClockSettings:
     if need_save:
       self.save_settings()
 
+  def _sysex_set_utc(self, tokens: list[str]) -> bool:
+    hours = int(tokens[1])
+    minutes = int(tokens[2])
+    seconds = int(tokens[3])
+
+    current_time = self.moon_clock.rtc.datetime
+    new_time = time.struct_time((current_time.tm_year, current_time.tm_mon, current_time.tm_mday, hours, minutes, seconds, current_time.tm_wday, -1, -1))
+    self.moon_clock.rtc.datetime = new_time
+    return False
+
+  def _sysex_set_date(self, tokens: list[str]) -> bool:
+    year = int(tokens[1])
+    month = int(tokens[2])
+    day = int(tokens[3])
+    dow = int(tokens[4])
+
+    current_time = self.moon_clock.rtc.datetime
+    new_time = time.struct_time((year, month, day, current_time.tm_hour, current_time.tm_min, current_time.tm_sec, dow, -1, -1))
+    self.moon_clock.rtc.datetime = new_time
+    return False
+
+  def _sysex_set_offset(self, tokens: list[str]) -> bool:
+    self.settings_dict["utc_offset_seconds"] = int(tokens[1])
+    self._update_utc_offset()
+    return True
+
+  def _sysex_set_dst(self, tokens: list[str]) -> bool:
+    self.settings_dict["dst_strategy"] = tokens[1]
+    self._dst_cache_key = -1
+    return True
+
+  def _sysex_set_pos(self, tokens: list[str]) -> bool:
+    self.settings_dict["latitude_millionths"] = int(tokens[1])
+    self.settings_dict["longitude_millionths"] = int(tokens[2])
+    self._update_observer_position()
+    return True
+
+  def _sysex_stop_cal(self, tokens: list[str]) -> bool:
+    self.is_test_mode = False
+    return False
+
+  def _sysex_cal(self, tokens: list[str]) -> bool:
+    self.is_test_mode = True
+    channel = int(tokens[1]) % 2
+    value = int(tokens[2]) % 4096
+    # Enter interactive calibration mode with value 4095, otherwise just push value to DAC from sysex.
+    if value < 4095:
+      self.moon_clock.dac_driver.load_dac_value(channel, value)
+      self.moon_clock.dac_driver.latch_dacs()
+    else:
+      self.run_interactive_cal(channel)
+    return False
+
   def run_interactive_cal(self, channel: int):
     """Run a loop of grabbing ADC and sending it to DAC, with printing, until set to max value."""
     while True:
@@ -175,68 +255,122 @@ class MoonClockSettings:
       return
 
     self.settings_dict.update(settings_dict)
+    self._update_utc_offset()
+    self._update_observer_position()
+    self._dst_cache_key = -1
 
   def save_settings(self):
     self.moon_clock.save_json_settings(self.settings_dict)
 
+  def _update_utc_offset(self):
+    self._utc_offset_seconds = self.settings_dict["utc_offset_seconds"]
+    self._utc_offset = timedelta(seconds=self._utc_offset_seconds)
+
+  def _update_observer_position(self):
+    self._obs_lat_degrees = self.settings_dict.get('latitude_millionths', 0) / 1e6
+    self._obs_lon_degrees = self.settings_dict.get('longitude_millionths', 0) / 1e6
+
+  @property
+  def obs_lat_degrees(self) -> float:
+    return self._obs_lat_degrees
+
+  @property
+  def obs_lon_degrees(self) -> float:
+    return self._obs_lon_degrees
+
+  @property
+  def utc_offset(self) -> timedelta:
+    """UTC offset of local standard time, without DST."""
+    return self._utc_offset
+
 
-  def get_dst_hours_delta(self, local_datetime_before_dst: datetime) -> timedelta:
+  def get_dst_seconds(self, year: int, month: int, day: int, hour: int) -> int:
+    """Return the DST offset in seconds to add to the given local standard (pre-DST) time."""
+    # DST can only change on an hour boundary, so consecutive calls within the same hour reuse the last
+    # answer. The key is a plain int to avoid allocating a tuple per call.
+    key = (((year * 13) + month) * 32 + day) * 24 + hour
+    if key == self._dst_cache_key:
+      return self._dst_cache_seconds
+
+    dst_seconds = self._compute_dst_seconds(year, month, day, hour)
+    self._dst_cache_key = key
+    self._dst_cache_seconds = dst_seconds
+    return dst_seconds
+
+  def _compute_dst_seconds(self, year: int, month: int, day: int, hour: int) -> int:
     strategy = self.settings_dict["dst_strategy"]
     if strategy == "none":
-      return timedelta(0)
+      return 0
 
     if strategy == "canada":
       # On the second Sunday in March, at 2:00 a.m. EST, clocks are advanced to 3:00 a.m. EDT,
       # creating a 23-hour day. On the first Sunday in November, at 2:00 a.m. EDT,
       # clocks are moved back to 1:00 a.m. EST, which results in a 25-hour day
-      SUNDAY = 6
-      MARCH = 3
-      NOVEMBER = 11
-
-      month = local_datetime_before_dst.month
-      day = local_datetime_before_dst.day
-      hour = local_datetime_before_dst.hour
-
-      second_sunday_of_march = get_date_of_nth_weekday_of_month(local_datetime_before_dst.year, MARCH, SUNDAY, num=2)
-      first_sunday_of_october = get_date_of_nth_weekday_of_month(local_datetime_before_dst.year, NOVEMBER, SUNDAY, num=1)
-      if month >= MARCH and month <= NOVEMBER:
-        if month == MARCH:
-          if day >= second_sunday_of_march and hour >= 2:
-            return timedelta(hours=1)
-          else:
-            return timedelta(hours=0)
-        elif month == NOVEMBER:
-          if day <= first_sunday_of_october and hour < 1:
-            return timedelta(hours=1)
-          else:
-            return timedelta(hours=0)
+      if month < _MARCH or month > _NOVEMBER:
+        return 0
+      if _MARCH < month < _NOVEMBER:
+        return _DST_SECONDS
+
+      if year != self._dst_cache_year:
+        self._dst_anchors = (
+          get_date_of_nth_weekday_of_month(year, _MARCH, _SUNDAY, num=2),
+          get_date_of_nth_weekday_of_month(year, _NOVEMBER, _SUNDAY, num=1)
+        )
+        self._dst_cache_year = year
+      second_sunday_of_march, first_sunday_of_november = self._dst_anchors
+
+      if month == _MARCH:
+        if day >= second_sunday_of_march and hour >= 2:
+          return _DST_SECONDS
         else:
-          return timedelta(hours=1)
+          return 0
+      else:
+        if day <= first_sunday_of_november and hour < 1:
+          return _DST_SECONDS
+        else:
+          return 0
 
-    return timedelta(hours=0)
+    return 0
 
   def to_local_time(self, now_utc_datetime: datetime) -> datetime:
-    local_datetime_before_dst = now_utc_datetime + timedelta(seconds=self.settings_dict["utc_offset_seconds"])
-    dst_offset = self.get_dst_hours_delta(local_datetime_before_dst)
-    local_datetime = local_datetime_before_dst + dst_offset
+    local_datetime = now_utc_datetime + self._utc_offset
+    # DST rules apply to the local standard time, so only a second addition when DST is in effect.
+    dst_seconds = self.get_dst_seconds(local_datetime.year, local_datetime.month, local_datetime.day, local_datetime.hour)
+    if dst_seconds != 0:
+      local_datetime += timedelta(seconds=dst_seconds)
 
     return local_datetime
 
   def to_utc_time(self, now_local_datetime: datetime) -> datetime:
-    dst_offset = self.get_dst_hours_delta(now_local_datetime)
-    utc_datetime = now_local_datetime - dst_offset
-    utc_datetime -= timedelta(seconds=self.settings_dict["utc_offset_seconds"])
-
-    return utc_datetime
+    dst_seconds = self.get_dst_seconds(now_local_datetime.year, now_local_datetime.month, now_local_datetime.day, now_local_datetime.hour)
+    if dst_seconds == 0:
+      return now_local_datetime - self._utc_offset
+    return now_local_datetime - timedelta(seconds=self._utc_offset_seconds + dst_seconds)
+
+  def get_local_time(self, now: time.struct_time) -> time.struct_time:
+    """Get local time for the RTC reading `now`, using integer epoch math rather than datetime objects."""
+    # The RTC only ticks once a second, so only redo the conversion when it changed.
+    key = (now.tm_year, now.tm_mon, now.tm_mday, now.tm_hour, now.tm_min, now.tm_sec)
+    if key == self._last_rtc_key:
+      return self._last_local_time
+
+    epoch_seconds = time.mktime(now) + self._utc_offset_seconds
+    local_time = time.localtime(epoch_seconds)
+    dst_seconds = self.get_dst_seconds(local_time.tm_year, local_time.tm_mon, local_time.tm_mday, local_time.tm_hour)
+    if dst_seconds != 0:
+      local_time = time.localtime(epoch_seconds + dst_seconds)
+
+    self._last_rtc_key = key
+    self._last_local_time = local_time
+    self._local_day_key = (((local_time.tm_year * 13) + local_time.tm_mon) * 32) + local_time.tm_mday
+    return local_time
 
-  def get_local_time(self) -> datetime:
-    now = self.moon_clock.rtc.datetime
-    now_datetime = datetime(now.tm_year, now.tm_mon, now.tm_mday, now.tm_hour, now.tm_min, now.tm_sec)
-
-    return self.to_local_time(now_datetime)
+  @property
+  def local_day_key(self) -> int:
+    """Local day of the last get_local_time() result, as an int that changes whenever the date does."""
+    return self._local_day_key
 
-  def get_jd(self) -> float:
-    now = self.moon_clock.rtc.datetime
+  def get_jd(self, now: time.struct_time) -> float:
     jd = julian.date_to_julian_day(now.tm_year, now.tm_mon, now.tm_mday) + julian.time_to_fraction(now.tm_hour, now.tm_min, now.tm_sec)
     return jd
 
@@ -246,7 +380,8 @@ class AstroDataComputer:
 
     self._moon_clock = moon_clock
 
-    self._last_full_day_process_time: datetime = OLD_DATE
+    # Local (year, month, day) of the last full-day processing, packed in an int; 0 forces the first run.
+    self._last_full_day_key: int = 0
 
     self._moon_rise_time: datetime = OLD_DATE
     self._moon_set_time: datetime = OLD_DATE
@@ -264,45 +399,91 @@ class AstroDataComputer:
 
     self._last_moon_age: float = 0.0
 
-    self.LUNAR_PHASE_UPDATE_PERIOD_SECONDS = 10.0
+    # Normalized lunar age from the full ephemeris, re-anchored every hour (keyed by int(jd * 24)) and
+    # extrapolated at the mean rate in between.
+    self._lunar_anchor_hour: int = -1
+    self._lunar_anchor_jd: float = 0.0
+    self._lunar_anchor_age: float = 0.0
+
+    # "HH:MM" scratch buffer for time2str()
+    self._hhmm_buf = bytearray(b"00:00")
+
+    # Last DAC count written to the phase dial; -1 forces the first write.
+    self._last_dac_value: int = -1
+    # The set_*_dial methods only load the DACs, process() latches both channels at once when this is set.
+    self._dac_latch_pending: bool = False
 
   def set_phase_dial_to_days(self, days:float):
-    # Values for prototype breadboard
-    # dac_value = int(polynomial.poly_eval(days, [5.046e+02, 1.174e+02, -6.444e-01]))
+    # Linear interpolation between 0.1 day LUT entries: the curve's curvature is small enough that
+    # this stays within one DAC count of the quadratic.
+    pos = days * _PHASE_LUT_STEPS_PER_DAY
+    if pos <= 0:
+      dac_value = PHASE_DIAL_LUT[0]
+    elif pos >= _PHASE_LUT_LAST_IDX:
+      dac_value = PHASE_DIAL_LUT[_PHASE_LUT_LAST_IDX]
+    else:
+      idx = int(pos)
+      low = PHASE_DIAL_LUT[idx]
+      dac_value = low + int((PHASE_DIAL_LUT[idx + 1] - low) * (pos - idx))
+    if dac_value == self._last_dac_value:
+      return
+    self._last_dac_value = dac_value
 
-    # Values for REV1 PCB
-    dac_value = int(polynomial.poly_eval(days, [631.26, 125.6, -0.768]))
     print("Setting moon phase days %.3f to DAC %d" % (days, dac_value))
 
     self._moon_clock.dac_driver.load_dac_value(CHANNEL_MOON_PHASE, dac_value)
-    self._moon_clock.dac_driver.latch_dacs()
+    self._dac_latch_pending = True
 
   def set_moonless_hours_dial(self, moonless_hours: float):
-    value = int(linear_interp_in_parts(moonless_hours, MOONLESS_HOURS_POINTS))
+    value = int(linear_interp_xy(moonless_hours, MOONLESS_HOURS_X, MOONLESS_HOURS_Y))
     self._moon_clock.dac_driver.load_dac_value(CHANNEL_MOONLESS_HOURS, value)
-    self._moon_clock.dac_driver.latch_dacs()
+    self._dac_latch_pending = True
+
+  def latch_pending_dacs(self):
+    if self._dac_latch_pending:
+      self._dac_latch_pending = False
+      self._moon_clock.dac_driver.latch_dacs()
 
-  def update_lunar_phase(self, now: float):
-    if (now - self._last_moon_age) < self.LUNAR_PHASE_UPDATE_PERIOD_SECONDS:
+  def update_lunar_phase(self, now: float, utc_now: time.struct_time):
+    if (now - self._last_moon_age) < LUNAR_PHASE_UPDATE_PERIOD_SECONDS:
       return
 
     self._last_moon_age = now
-    normalized_to_28_days = moon.lunar_age_normalized_28_days(jd=self._settings.get_jd())
+    if self._settings.is_test_mode:
+      # Calibration writes the DACs directly, so don't trust the last value we wrote.
+      self._last_dac_value = -1
+    jd = self._settings.get_jd(utc_now)
+    anchor_hour = int(jd * 24.0)
+    if anchor_hour != self._lunar_anchor_hour or jd < self._lunar_anchor_jd:
+      normalized_to_28_days = moon.lunar_age_normalized_28_days(jd=jd)
+      self._lunar_anchor_hour = anchor_hour
+      self._lunar_anchor_jd = jd
+      self._lunar_anchor_age = normalized_to_28_days
+    else:
+      normalized_to_28_days = self._lunar_anchor_age + (jd - self._lunar_anchor_jd) * LUNAR_AGE_NORMALIZED_RATE
+      if normalized_to_28_days >= 28.0:
+        normalized_to_28_days -= 28.0
     self._normalized_moon_age = normalized_to_28_days
     self.set_phase_dial_to_days(normalized_to_28_days)
 
-  def events_for_current_day(self, local_time: datetime, events: list[RiseSetEvent]) -> RiseSetTimes:
+  def events_for_current_day(self, local_time: datetime, events: list[tuple[datetime, bool]]) -> RiseSetTimes:
+    """Find the first rise and set on the day of `local_time` among `events`, given as (moment, is_rise) tuples."""
     rise_time = None
     set_time = None
 
-    for event in events:
-      if event.is_rise and (local_time.date() == event.moment.date()):
-        rise_time = event.moment
-        break
-
-    for event in events:
-      if not event.is_rise and (local_time.date() == event.moment.date()):
-        set_time = event.moment
+    # Single pass, comparing date fields directly rather than allocating date objects per event.
+    year = local_time.year
+    month = local_time.month
+    day = local_time.day
+    for moment, is_rise in events:
+      if moment.day != day or moment.month != month or moment.year != year:
+        continue
+      if is_rise:
+        if rise_time is None:
+          rise_time = moment
+      elif set_time is None:
+        set_time = moment
+      if rise_time is not None and set_time is not None:
         break
 
     return RiseSetTimes(rise_time, set_time)
@@ -312,53 +493,56 @@ class AstroDataComputer:
     if moment is None:
       return "----"
 
-    return "{:02}:{:02}".format(moment.hour, moment.minute)
-
-  def process_rise_set(self, local_time: datetime, is_today: bool):
-    utc_time = self._settings.to_utc_time(local_time)
-
-    sun_events = []
-    moon_events = []
-
-    utc = utc_time - timedelta(days=1)
-    for _ in range(3):
-        gc.collect()
-        print(gc.mem_free())
-        jd = julian.date_to_julian_day(utc.year, utc.month, utc.day)
-
-        obs_lat = self._settings.settings_dict.get('latitude_millionths', 0) / 1e6
-        obs_lon = self._settings.settings_dict.get('longitude_millionths', 0) / 1e6
+    buf = self._hhmm_buf
+    _write2(buf, 0, moment.hour)
+    _write2(buf, 3, moment.minute)
+    return str(buf, "ascii")
+
+  def _event_local_time(self, local_day_start: datetime, event_hours: float) -> datetime:
+    """Local time of an event `event_hours` after UTC midnight, with `local_day_start` that midnight in local standard time."""
+    hms = hours_to_hms(event_hours)
+    local_datetime = local_day_start + timedelta(hours=hms.hours, minutes=hms.minutes, seconds=int(hms.seconds))
+    # DST is looked up per event since the 3-day window can straddle a transition.
+    dst_seconds = self._settings.get_dst_seconds(local_datetime.year, local_datetime.month, local_datetime.day, local_datetime.hour)
+    if dst_seconds != 0:
+      local_datetime += timedelta(seconds=dst_seconds)
+    return local_datetime
 
-        # ====== SUN ======
-        sun_positions = get_sun_positions_for_event(jd)
-        moon_positions = get_moon_positions_for_event(jd)
+  def _rise_set_for_local_day(self, local_time: datetime, positions_window: PositionsWindow, local_day_start: datetime, obs_lat: float, obs_lon: float) -> RiseSetTimes:
+    """Find the rise/set on the local day of `local_time`, from the UTC days around that of `positions_window`.
 
-        sun_event_times: RiseTransitSetTimes = get_event_time(jd, object_positions=sun_positions, obs_lat_degrees=obs_lat, obs_lon_degrees=obs_lon)
-        moon_event_times: RiseTransitSetTimes = get_event_time(jd, object_positions=moon_positions, obs_lat_degrees=obs_lat, obs_lon_degrees=obs_lon)
+    UTC days are tried in order from the previous one, and the first match wins, so the next UTC day is
+    only computed when the previous and current ones did not provide both events.
+    """
+    events = []
+    rise_set = None
+    for day_offset in (-1, 0, 1):
+      debug_gc()
+      event_times: RiseTransitSetTimes = get_event_time(positions_window.jd + day_offset, object_positions=positions_window.positions(day_offset), obs_lat_degrees=obs_lat, obs_lon_degrees=obs_lon)
 
-        sun_rise_hms = hours_to_hms(sun_event_times.rise_time_hours)
-        sun_set_hms = hours_to_hms(sun_event_times.set_time_hours)
+      day_start = local_day_start + timedelta(days=day_offset)
+      events.append((self._event_local_time(day_start, event_times.rise_time_hours), True))
+      events.append((self._event_local_time(day_start, event_times.set_time_hours), False))
 
-        local_sun_rise_time = self._settings.to_local_time(datetime(utc.year, utc.month, utc.day, sun_rise_hms.hours, sun_rise_hms.minutes, int(sun_rise_hms.seconds)))
-        local_sun_set_time = self._settings.to_local_time(datetime(utc.year, utc.month, utc.day, sun_set_hms.hours, sun_set_hms.minutes, int(sun_set_hms.seconds)))
+      rise_set = self.events_for_current_day(local_time, events)
+      if rise_set.rise_time is not None and rise_set.set_time is not None:
+        break
 
-        moon_rise_hms = hours_to_hms(moon_event_times.rise_time_hours)
-        moon_set_hms = hours_to_hms(moon_event_times.set_time_hours)
+    return rise_set
 
-        local_moon_rise_time = self._settings.to_local_time(datetime(utc.year, utc.month, utc.day, moon_rise_hms.hours, moon_rise_hms.minutes, int(moon_rise_hms.seconds)))
-        local_moon_set_time = self._settings.to_local_time(datetime(utc.year, utc.month, utc.day, moon_set_hms.hours, moon_set_hms.minutes, int(moon_set_hms.seconds)))
+  def process_rise_set(self, local_time: datetime, is_today: bool):
+    utc_time = self._settings.to_utc_time(local_time)
 
-        sun_events.append(RiseSetEvent(moment=local_sun_rise_time, is_rise=True))
-        sun_events.append(RiseSetEvent(moment=local_sun_set_time, is_rise=False))
-        moon_events.append(RiseSetEvent(moment=local_moon_rise_time, is_rise=True))
-        moon_events.append(RiseSetEvent(moment=local_moon_set_time, is_rise=False))
+    obs_lat = self._settings.obs_lat_degrees
+    obs_lon = self._settings.obs_lon_degrees
 
-        utc += timedelta(days=1)
+    jd = julian.date_to_julian_day(utc_time.year, utc_time.month, utc_time.day)
+    # Event times are hours past UTC midnight, so they are offset from that midnight shifted to local
+    # standard time, built once here rather than per event.
+    local_day_start = datetime(utc_time.year, utc_time.month, utc_time.day) + self._settings.utc_offset
 
-    gc.collect()
-    print(gc.mem_free())
-    sun_rise_set = self.events_for_current_day(local_time, sun_events)
-    moon_rise_set = self.events_for_current_day(local_time, moon_events)
+    sun_rise_set = self._rise_set_for_local_day(local_time, get_sun_positions_window(jd), local_day_start, obs_lat, obs_lon)
+    moon_rise_set = self._rise_set_for_local_day(local_time, get_moon_positions_window(jd), local_day_start, obs_lat, obs_lon)
 
     if is_today:
       self._sun_rise_time = sun_rise_set.rise_time
@@ -367,8 +551,9 @@ class AstroDataComputer:
       self._moon_rise_time = moon_rise_set.rise_time
       self._moon_set_time = moon_rise_set.set_time
 
-      print("{}/{} Sun: rise {} set {}".format(local_time.month, local_time.day, self.time2str(self._sun_rise_time), self.time2str(self._sun_set_time)))
-      print("{}/{} Moon: rise {} set {}".format(local_time.month, local_time.day, self.time2str(self._moon_rise_time), self.time2str(self._moon_set_time)))
+      if VERBOSE_DAILY:
+        print("{}/{} Sun: rise {} set {}".format(local_time.month, local_time.day, self.time2str(self._sun_rise_time), self.time2str(self._sun_set_time)))
+        print("{}/{} Moon: rise {} set {}".format(local_time.month, local_time.day, self.time2str(self._moon_rise_time), self.time2str(self._moon_set_time)))
     else:
       self._next_moon_rise_time = moon_rise_set.rise_time
       self._next_moon_set_time = moon_rise_set.set_time
@@ -406,15 +591,17 @@ class AstroDataComputer:
         # Moon not yet set, but setting
         extra_moonlight: timedelta = next_moon_set - twilight
         moonless_hours = 4.5 - (extra_moonlight.total_seconds() / 3600.0)
-        pt("1tw", twilight)
-        pt("1ms", next_moon_set)
-        print("Moon not yet set, moonless=%.1f" % moonless_hours)
+        if VERBOSE_DAILY:
+          pt("1tw", twilight)
+          pt("1ms", next_moon_set)
+          print("Moon not yet set, moonless=%.1f" % moonless_hours)
       else:
         # Moon set, but could rise
-        pt("2tw", twilight)
-        pt("2mr", next_moon_rise)
         moonless_hours = (next_moon_rise - twilight).total_seconds() / 3600.0
-        print("Moon not yet risen, moonless=%.1f" % moonless_hours)
+        if VERBOSE_DAILY:
+          pt("2tw", twilight)
+          pt("2mr", next_moon_rise)
+          print("Moon not yet risen, moonless=%.1f" % moonless_hours)
 
     if moonless_hours < 0.0:
       moonless_hours = 0.0
@@ -424,22 +611,25 @@ class AstroDataComputer:
     self._moonless_hours = moonless_hours
     self.set_moonless_hours_dial(self._moonless_hours)
 
-  def process(self, now: float, local_time: datetime):
-    self.update_lunar_phase(now)
+  def process(self, now: float, utc_now: time.struct_time, local_time: time.struct_time, day_key: int):
+    self.update_lunar_phase(now, utc_now)
 
-    if local_time.date() != self._last_full_day_process_time.date():
-      self._last_full_day_process_time = local_time
+    if day_key != self._last_full_day_key:
+      self._last_full_day_key = day_key
+      # Only materialize a datetime for the once-a-day rise/set computations.
+      local_time = datetime(local_time.tm_year, local_time.tm_mon, local_time.tm_mday, local_time.tm_hour, local_time.tm_min, local_time.tm_sec)
 
-      gc.collect()
+      debug_gc()
       self.process_rise_set(local_time, is_today=True)
-      gc.collect()
-      print(gc.mem_free())
+      debug_gc()
       self.process_rise_set(local_time + timedelta(days=1), is_today=False)
-      gc.collect()
-      print(gc.mem_free())
+      debug_gc()
       self.process_moonless_hours(local_time)
-      gc.collect()
-      print(gc.mem_free())
+      # The daily computations leave a lot of garbage behind, collect it once here.
+      run_gc()
+
+    # Both dials loaded in this pass (if any) switch over together.
+    self.latch_pending_dacs()
 
   @property
   def moon_local_rise_time(self) -> datetime:
@@ -489,8 +679,8 @@ class Screen:
     self._screen_change_action = None
     return retval
 
-  def loop(self, now: float):
-    """Executed continously by the main loop."""
+  def loop(self, now: float, local_time: time.struct_time):
+    """Executed continously by the main loop, with the local time already computed for this iteration."""
     pass
 
   def back(self):
@@ -507,6 +697,8 @@ class TextDisplayScreen(Screen):
     self._num_elements = num_elements
     self._strings: list[str] = [""] * num_elements
     self._current_idx = 0
+    # Text (str or bytes) currently shown on the display, None when unknown.
+    self._last_rendered = None
     self._marquee_time_seconds = 2.5
 
     # Number of seconds before we force-refresh our garbage dispaly
@@ -519,32 +711,41 @@ class TextDisplayScreen(Screen):
   def on_right_button_press(self):
     self._screen_change_action = {"action": "next"}
 
+  def on_screen_enter(self):
+    # Another screen owned the display until now, so the next render must redraw.
+    self._last_rendered = None
+
   def render(self):
-    self._display.clear_all()
+    text = self._strings[self._current_idx]
 
-    # HACK: Display with fake MAX7219 dies at random
+    # HACK: Display with fake MAX7219 dies at random. Periodically rewriting its control registers and
+    # resending the framebuffer brings it back without blanking it.
     self._num_seconds_refresh += 1
     if self._num_seconds_refresh == NUM_SECONDS_TO_RESET_DISPLAY:
       self._num_seconds_refresh = 0
-      run_gc()
-      self._display.init_display()
-      self._display.clear_all()
-      self._display.show()
-      run_gc()
+      self._display.refresh_control_regs()
+
+    # Skip the SPI traffic entirely if the display already shows this text.
+    if text == self._last_rendered:
+      return
+    # Byte buffers get patched in place, so remember a snapshot of their contents rather than the buffer.
+    self._last_rendered = bytes(text) if isinstance(text, bytearray) else text
 
-    self._display.display_text(3, 0, self._strings[self._current_idx])
+    self._display.clear_all()
+    self._display.display_text(3, 0, text)
     self._display.show()
 
-  def compute_strings(self, local_time: datetime):
+  def compute_strings(self, local_time: time.struct_time, idx: int):
+    """Refresh self._strings[idx], the only slot about to be rendered."""
     pass
 
-  def loop(self, now: float, local_time: datetime):
+  def loop(self, now: float, local_time: time.struct_time):
     if now - self._last_print < 1.0:
       return
 
     self._last_print = now
 
-    self.compute_strings(local_time)
+    self.compute_strings(local_time, self._current_idx)
     self.render()
 
     # Process marquee
@@ -557,38 +758,69 @@ class TextDisplayScreen(Screen):
 class LocalTimeScreen(TextDisplayScreen):
   def __init__(self, display: CustomMatrix, settings: MoonClockSettings):
     super().__init__(display, settings, num_elements=1)
+    # "HH:MM:SS" template whose digits get patched in place every second.
+    self._buf = bytearray(b"00:00:00")
 
-  def compute_strings(self, local_time: datetime):
-    t = local_time.timetuple()
-    self._strings[0] = "{:02}:{:02}:{:02}".format(t.tm_hour, t.tm_min, t.tm_sec)
+  def compute_strings(self, local_time: time.struct_time, idx: int):
+    buf = self._buf
+    _write2(buf, 0, local_time.tm_hour)
+    _write2(buf, 3, local_time.tm_min)
+    _write2(buf, 6, local_time.tm_sec)
+    self._strings[0] = str(buf, "ascii")
 
 class DateScreen(TextDisplayScreen):
   def __init__(self, display: CustomMatrix, settings: MoonClockSettings):
     super().__init__(display, settings, num_elements=1)
     self._months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+    self._last_day_key = 0
 
-  def compute_strings(self, local_time: datetime):
-    self._strings[0] = "{} {}".format(self._months[local_time.month - 1], local_time.day)
+  def compute_strings(self, local_time: time.struct_time, idx: int):
+    # The date only changes once a day, so only format it when the month/day does.
+    day_key = (local_time.tm_mon * 32) + local_time.tm_mday
+    if day_key == self._last_day_key:
+      return
+    self._last_day_key = day_key
+    self._strings[0] = "{} {}".format(self._months[local_time.tm_mon - 1], local_time.tm_mday)
 
-class MoonRiseSetScreen(TextDisplayScreen):
-  def __init__(self, display: CustomMatrix, settings: MoonClockSettings, astro_computer: AstroDataComputer):
-    super().__init__(display, settings, num_elements=2)
+class RiseSetScreen(TextDisplayScreen):
+  """Marquee of "<prefix>HH:MM" rise/set times, patched in place into fixed-width byte buffers."""
+  def __init__(self, display: CustomMatrix, settings: MoonClockSettings, astro_computer: AstroDataComputer, prefixes: tuple):
+    super().__init__(display, settings, num_elements=len(prefixes))
     self._astro_computer = astro_computer
+    self._buffers = [bytearray(prefix + b"00:00") for prefix in prefixes]
+    # Shown instead when there is no such event on the day.
+    self._no_event_texts = [prefix + b"----" for prefix in prefixes]
+
+  def get_moment(self, idx: int) -> datetime:
+    """Return the local time of the event shown in slot `idx`, or None."""
+    return None
 
-  def compute_strings(self, local_time: datetime):
+  def compute_strings(self, local_time: time.struct_time, idx: int):
+    moment = self.get_moment(idx)
+    if moment is None:
+      self._strings[idx] = self._no_event_texts[idx]
+      return
+
+    buf = self._buffers[idx]
+    _write2(buf, 3, moment.hour)
+    _write2(buf, 6, moment.minute)
+    self._strings[idx] = buf
+
+class MoonRiseSetScreen(RiseSetScreen):
+  def __init__(self, display: CustomMatrix, settings: MoonClockSettings, astro_computer: AstroDataComputer):
+    super().__init__(display, settings, astro_computer, prefixes=(b"MR:", b"MS:"))
+
+  def get_moment(self, idx: int) -> datetime:
     ac = self._astro_computer
-    self._strings[0] = "MR:%s" % (ac.time2str(ac.moon_local_rise_time))
-    self._strings[1] = "MS:%s" % (ac.time2str(ac.moon_local_set_time))
+    return ac.moon_local_rise_time if idx == 0 else ac.moon_local_set_time
 
-class SunRiseSetScreen(TextDisplayScreen):
+class SunRiseSetScreen(RiseSetScreen):
   def __init__(self, display: CustomMatrix, settings: MoonClockSettings, astro_computer: AstroDataComputer):
-    super().__init__(display, settings, num_elements=2)
-    self._astro_computer = astro_computer
+    super().__init__(display, settings, astro_computer, prefixes=(b"SR:", b"SS:"))
 
-  def compute_strings(self, local_time: datetime):
+  def get_moment(self, idx: int) -> datetime:
     ac = self._astro_computer
-    self._strings[0] = "SR:%s" % (ac.time2str(ac.sun_local_rise_time))
-    self._strings[1] = "SS:%s" % (ac.time2str(ac.sun_local_set_time))
+    return ac.sun_local_rise_time if idx == 0 else ac.sun_local_set_time
 
 class ScreenStateMachine:
   STATE_UI = 0
@@ -609,8 +841,9 @@ class ScreenStateMachine:
 
     display = self.moon_clock.display
 
-    # Monkey-patch "display_text" method onto every display
+    # Monkey-patch "display_text" and "refresh_control_regs" methods onto every display
     display.display_text = self.moon_clock.display_text
+    display.refresh_control_regs = self.moon_clock.refresh_display_control_regs
 
     self.all_screens = [
       LocalTimeScreen(display, self.settings),
@@ -660,7 +893,7 @@ class ScreenStateMachine:
       self.current_screen.on_screen_enter()
       self.current_screen.render()
 
-  def loop(self, now: float, local_time: datetime):
+  def loop(self, now: float, local_time: time.struct_time):
     self.current_screen.loop(now, local_time)
     self.process_screen_change_action()
 
@@ -674,31 +907,48 @@ class MoonClockFirmware:
     self.astro_data_computer = AstroDataComputer(self.moon_clock, self.settings)
     self.state_machine = ScreenStateMachine(self.moon_clock, self.settings, self.astro_data_computer)
 
+    # References used on every loop iteration, resolved once here rather than through attribute chains
+    # (and a fresh bound-method object for the MIDI handler) each time.
+    self._sysex_handler = self.settings.process_sysex_setting
+    self._button_events = self.moon_clock.buttons.events
+    self._left_button_num = self.moon_clock.left_button_num
+    self._right_button_num = self.moon_clock.right_button_num
+
   def loop(self):
     moon_clock: MoonClock = self.moon_clock
+    state_machine = self.state_machine
 
-    moon_clock.process_midi(handler=self.settings.process_sysex_setting)
+    moon_clock.process_midi(handler=self._sysex_handler)
 
-    button = moon_clock.buttons.events.get()
+    button = self._button_events.get()
     if button and button.pressed:
-      if button.key_number == moon_clock.left_button_num:
-        self.state_machine.on_left_button_press()
-      elif button.key_number == moon_clock.right_button_num:
-        self.state_machine.on_right_button_press()
-
-    local_time = self.settings.get_local_time()
+      if button.key_number == self._left_button_num:
+        state_machine.on_left_button_press()
+      elif button.key_number == self._right_button_num:
+        state_machine.on_right_button_press()
+
+    # Single RTC read per iteration, shared by everything below.
+    utc_now = moon_clock.rtc.datetime
+    settings = self.settings
+    local_time = settings.get_local_time(utc_now)
     now = time.monotonic()
 
-    self.astro_data_computer.process(now, local_time)
+    # The day key is only recomputed with the local time, once per RTC second, not every iteration.
+    self.astro_data_computer.process(now, utc_now, local_time, settings.local_day_key)
 
-    self.state_machine.loop(now, local_time)
+    state_machine.loop(now, local_time)
 
 ######################################################################
 
 try:
     firmware = MoonClockFirmware()
     while True:
+      loop_start = time.monotonic()
       firmware.loop()
+      # Nothing needs more than ~50Hz, so sleep away the rest of the period rather than spinning.
+      loop_duration = time.monotonic() - loop_start
+      if loop_duration < MAIN_LOOP_PERIOD_SECONDS:
+        time.sleep(MAIN_LOOP_PERIOD_SECONDS - loop_duration)
 except MemoryError as e:
     print("MEMORY ERROR: " + str(e))
     reboot()
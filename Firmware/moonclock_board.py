@@ -1,7 +1,7 @@
 import board
 import busio
 import analogio
-from digitalio import Pull, Direction, DigitalInOut
+from digitalio import DigitalInOut
 import microcontroller
 import keypad
 import neopixel
@@ -12,14 +12,12 @@ import usb_midi
 from adafruit_bus_device.spi_device import SPIDevice
 from adafruit_max7219.matrices import CustomMatrix
 from adafruit_ds3231 import DS3231
-from adafruit_bitmap_font import bitmap_font
-import time
+from packed_bitmap_font import load_packed_font
 
 # Give us a chance to run GC on circuitpython
 try:
     import gc
-    def run_gc():
-        gc.collect()
+    run_gc = gc.collect
 except:
     def run_gc():
         pass
@@ -31,6 +29,25 @@ except ImportError:
 
 
 FONT_FILE = "fonts/moonclock.bdf"
+# FONT_FILE converted by utils/pack_bdf_font.py, preferred since it needs no parsing
+PACKED_FONT_FILE = "fonts/moonclock.bin"
+
+DISPLAY_BRIGHTNESS = 0
+
+# Settings are read back from NVM in slices of this many bytes
+NVM_READ_CHUNK_SIZE = 256
+
+# At most this many MIDI messages are handled per process_midi() call
+MIDI_MAX_MESSAGES_PER_CALL = 8
+
+# MAX7219 control registers and their values, see refresh_display_control_regs()
+MAX7219_CONTROL_REGS = (
+  (0x0F, 0),  # Display test: off
+  (0x09, 0),  # Decode mode: no BCD decode, raw segments
+  (0x0B, 7),  # Scan limit: all 8 rows
+  (0x0A, DISPLAY_BRIGHTNESS),  # Intensity
+  (0x0C, 1),  # Shutdown: normal operation
+)
 
 # Using CircuitPython 9.x with https://circuitpython.org/board/waveshare_rp2040_zero/
 # CircuitPython tips: https://github.com/todbot/circuitpython-tricks
@@ -41,6 +58,8 @@ class MCP49xxDriver:
     self._spi_device: SPIDevice = spi_device
     self._resolution_mask = (1 << resolution_bits) - 1
     self._ldac_pin = ldac_pin
+    # Reused for every DAC write, so loading a value doesn't allocate
+    self._tx_buf = bytearray(2)
 
   def load_dac_value(self, channel_idx: int, value: int):
     MCP49XX_CHAN_SEL_BIT = 1 << 15
@@ -59,14 +78,18 @@ class MCP49xxDriver:
     cfg_reg |= MCP49XX_CHAN_SEL_BIT if (channel_idx != 0) else 0
     cfg_reg |= code_val
 
+    tx_buf = self._tx_buf
+    tx_buf[0] = cfg_reg >> 8
+    tx_buf[1] = cfg_reg & 0xff
     with self._spi_device as spi:
-      spi.write(bytes([cfg_reg >> 8, cfg_reg & 0xff]))
+      spi.write(tx_buf)
 
   def latch_dacs(self):
-    self._ldac_pin.value = False
-    self._ldac_pin.value = False
-
-    self._ldac_pin.value = True
+    # The MCP49xx only needs LDAC low for 100ns. A single interpreted pin write already takes
+    # several microseconds, so no extra delay is needed between the edges.
+    ldac_pin = self._ldac_pin
+    ldac_pin.value = False
+    ldac_pin.value = True
 
 
 class MoonClock:
@@ -93,13 +116,23 @@ class MoonClock:
     self.display_cs_pin.pull = None
     self.display_cs_pin.switch_to_output(value=True)
 
-    self.font = bitmap_font.load_font(FONT_FILE)
+    try:
+      self.font = load_packed_font(PACKED_FONT_FILE)
+    except OSError:
+      # Packed font not deployed, parse the BDF instead. Only import the BDF parser when needed.
+      from adafruit_bitmap_font import bitmap_font
+      self.font = bitmap_font.load_font(FONT_FILE)
+    # Per-codepoint glyph runs for display_text(), rebuilt whenever self.font changes.
+    self._glyph_runs_font = None
+    self._glyph_runs_cache: dict = {}
+    self._font_height = 0
+    self._font_dy = 0
     run_gc()
     self.display_spi = busio.SPI(board.GP2, MOSI=board.GP3)
     #self.display_spi_device = SPIDevice(self.display_spi, chip_select=self.display_cs_pin, baudrate=1000000, polarity=0, phase=0)
     self.display = CustomMatrix(spi=self.display_spi, cs=self.display_cs_pin, width=32, height=8)
     self.display.init_display()
-    self.display.brightness(0)
+    self.display.brightness(DISPLAY_BRIGHTNESS)
     self.display.clear_all()
     self.display.show()
     run_gc()
@@ -136,27 +169,46 @@ class MoonClock:
     self._poll.register(usb_midi.ports[0], select.POLLIN)
 
 
-  def process_midi(self, handler: callable) -> bool:
+  def _midi_pending(self) -> bool:
     for _ in self._poll.ipoll(0):
+      return True
+    return False
+
+  def process_midi(self, handler: callable) -> None:
+    # Drain back-to-back messages in one call, bounded so a burst can't stall the main loop.
+    for _ in range(MIDI_MAX_MESSAGES_PER_CALL):
+      if not self._midi_pending():
+        break
+
       msg_in = self.midi_in.receive()
       if msg_in is None: continue
 
       if msg_in.type == smolmidi.SYSEX:
         sysex_payload, truncated = self.midi_in.receive_sysex(128)
-        handler("".join([chr(b) for b in sysex_payload]))
+        # SysEx data bytes are 7-bit, so this decodes in C to the same string as chr() per byte.
+        setting = bytes(sysex_payload).decode("utf-8")
+        handler(setting)
 
 
   def load_json_settings(self) -> dict:
-    json_str = []
+    # Settings JSON is stored from the start of NVM, terminated by 0x00 (or 0xff for erased flash).
+    # Read it in slices and search for the terminator in C, rather than indexing NVM byte by byte.
+    json_bytes = b""
     try:
-      for byte_idx in range(len(microcontroller.nvm)):
-        b = microcontroller.nvm[byte_idx]
-        if b == 0 or b == 0xff:
-          json_data = "".join(json_str)
+      nvm = microcontroller.nvm
+      nvm_len = len(nvm)
+      for start in range(0, nvm_len, NVM_READ_CHUNK_SIZE):
+        chunk = bytes(nvm[start:min(start + NVM_READ_CHUNK_SIZE, nvm_len)])
+        end = len(chunk)
+        for terminator in (b"\x00", b"\xff"):
+          idx = chunk.find(terminator)
+          if 0 <= idx < end:
+            end = idx
+        json_bytes += chunk[:end]
+        if end < len(chunk):
+          json_data = json_bytes.decode("utf-8")
           print("Loaded settings: ", json_data)
           return json.loads(json_data)
-        else:
-          json_str.append(chr(b))
     except Exception as e:
       print("Error loading settings: %s" % e)
       return {}
@@ -165,44 +217,102 @@ class MoonClock:
   def save_json_settings(self, val: dict):
     try:
       serialized_bytes = json.dumps(val).encode('utf-8')
+      all_bytes = serialized_bytes + b'\x00'
+      # Skip the flash erase/program cycle entirely when NVM already holds these settings.
+      if microcontroller.nvm[0:len(all_bytes)] == all_bytes:
+        return
       print("Saving: ", serialized_bytes)
-      all_bytes = serialized_bytes + '\x00'
+      # Single slice assignment, so the NVM driver programs the flash in one go.
       microcontroller.nvm[0:len(all_bytes)] = all_bytes
     except Exception as e:
       print("ERROR SAVING SETTINGS: %s!" % e)
 
 
-  def display_text(self, sx: int, sy: int, msg: str) -> None:
-    font = self.font
-    _, height, _, dy = font.get_bounding_box()
-    font.load_glyphs(msg)
+  def refresh_display_control_regs(self) -> None:
+    """Rewrite the MAX7219 control registers and resend the current framebuffer.
 
+    Recovers a display whose registers got corrupted without re-initializing and clearing it, so nothing blanks.
+    """
     if isinstance(self, MoonClock):
       disp = self.display
     else:
       disp = self
 
+    for register, value in MAX7219_CONTROL_REGS:
+      disp.write_cmd(register, value)
+    disp.show()
+
+  def _build_glyph_runs(self, font, code: int, height: int, dy: int) -> tuple:
+    """Return (advance, runs) for codepoint `code`, where runs is a flat tuple of (row, x_offset, length, value) lit runs."""
+    font.load_glyphs((code,))
+    glyph = font.get_glyph(code)
+    if not glyph:
+        return (0, ())
+
+    width = glyph.width
+    advance = glyph.shift_x if glyph.shift_x > width else width
+    bitmap = glyph.bitmap
+    glyph_height = glyph.height
+    # Bitmap row for display row y is y + row_offset
+    row_offset = (glyph_height - (height + dy)) + glyph.dy
+
+    runs = []
     for y in range(height):
-        x = sx
-        for c in msg:
-            npix = 0
-
-            glyph = font.get_glyph(ord(c))
-            if not glyph:
-                continue
-            glyph_y = y + (glyph.height - (height + dy)) + glyph.dy
-            if 0 <= glyph_y < glyph.height:
-                for i in range(glyph.width):
-                    value = glyph.bitmap[i, glyph_y]
-                    disp.pixel(x, sy + y, value)
-                    x += 1
-                    npix += 1
-            else:
-                # empty section for this glyph
-                for i in range(glyph.width):
-                    disp.pixel(x, sy + y, 0)
-                    x += 1
-                    npix += 1
-            for _ in range(glyph.shift_x - npix):
-                disp.pixel(x, sy + y, 0)
-                x += 1
+        glyph_y = y + row_offset
+        if not (0 <= glyph_y < glyph_height):
+            continue
+        run_start = 0
+        run_value = 0
+        for i in range(width):
+            value = bitmap[i, glyph_y]
+            if value != run_value:
+                if run_value:
+                    runs.extend((y, run_start, i - run_start, run_value))
+                run_start = i
+                run_value = value
+        if run_value:
+            runs.extend((y, run_start, width - run_start, run_value))
+
+    return (advance, tuple(runs))
+
+  def display_text(self, sx: int, sy: int, msg) -> None:
+    """Draw `msg` (a str, or bytes-like ASCII such as a reused bytearray) at (sx, sy)."""
+    if isinstance(self, MoonClock):
+      disp = self.display
+    else:
+      disp = self
+
+    font = self.font
+    if font is not self._glyph_runs_font:
+        # Font (re)loaded: cached runs belong to the previous one.
+        self._glyph_runs_font = font
+        self._glyph_runs_cache = {}
+        _, self._font_height, _, self._font_dy = font.get_bounding_box()
+    cache = self._glyph_runs_cache
+    height = self._font_height
+
+    # Glyph bitmaps are only decoded into runs the first time a codepoint is drawn. Iterating bytes-like
+    # messages yields ints instead of 1-char strings.
+    entries = []
+    total_advance = 0
+    for c in msg:
+        code = c if isinstance(c, int) else ord(c)
+        entry = cache.get(code)
+        if entry is None:
+            entry = self._build_glyph_runs(font, code, height, self._font_dy)
+            cache[code] = entry
+        entries.append(entry)
+        total_advance += entry[0]
+
+    if total_advance <= 0 or height <= 0:
+        return
+
+    # Blank the whole text box with one fill_rect(), then only draw the lit runs, one fill_rect() per run.
+    # Columns past a glyph's bitmap width up to shift_x stay blank.
+    disp.fill_rect(sx, sy, total_advance, height, 0)
+
+    x = sx
+    for advance, runs in entries:
+        for idx in range(0, len(runs), 4):
+            disp.fill_rect(x + runs[idx + 1], sy + runs[idx], runs[idx + 2], 1, runs[idx + 3])
+        x += advance
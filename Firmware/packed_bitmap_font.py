@@ -0,0 +1,80 @@
+import struct
+
+# Packed bitmap font, converted offline from BDF by utils/pack_bdf_font.py, so nothing is parsed at runtime.
+#
+# Layout (little-endian):
+#   - Header: magic (I), bounding box width, height, dx, dy (bbbb), first codepoint (H), number of glyphs (H)
+#   - One record per codepoint from the first one: width, height (BB), dx, dy, shift_x (bbb), bitmap offset (H).
+#     Codepoints missing from the font have width MISSING_GLYPH_WIDTH.
+#   - Glyph bitmaps: `height` rows of (width + 7) // 8 bytes, top row first, leftmost pixel in the MSB.
+PACKED_FONT_MAGIC = 0x7abf0001
+HEADER_FORMAT = "<IbbbbHH"
+GLYPH_FORMAT = "<BBbbbH"
+MISSING_GLYPH_WIDTH = 0xFF
+
+
+class PackedGlyphBitmap:
+    """Read-only view of one glyph in the packed bitmap data, indexed as bitmap[x, y] like displayio.Bitmap."""
+    def __init__(self, data: bytes, offset: int, width: int):
+        self._data = data
+        self._offset = offset
+        self._row_bytes = (width + 7) // 8
+
+    def __getitem__(self, xy) -> int:
+        x, y = xy
+        return (self._data[self._offset + (y * self._row_bytes) + (x >> 3)] >> (7 - (x & 7))) & 1
+
+
+class PackedGlyph:
+    def __init__(self, bitmap: PackedGlyphBitmap, width: int, height: int, dx: int, dy: int, shift_x: int):
+        """Glyph metrics and bitmap, with the same attributes as adafruit_bitmap_font's Glyph that we use.
+
+        This is a cheesy dataclass, since MicroPython doesn't have them.
+        """
+        self.bitmap = bitmap
+        self.width = width
+        self.height = height
+        self.dx = dx
+        self.dy = dy
+        self.shift_x = shift_x
+        self.shift_y = 0
+
+
+class PackedBitmapFont:
+    """Drop-in for the parts of adafruit_bitmap_font's fonts used by MoonClock.display_text(), from packed data."""
+    def __init__(self, packed: bytes):
+        magic, bbox_width, bbox_height, bbox_dx, bbox_dy, first_code, num_glyphs = struct.unpack_from(HEADER_FORMAT, packed, 0)
+        if magic != PACKED_FONT_MAGIC:
+            raise ValueError("Wrong packed font format")
+
+        self._packed = packed
+        self._bounding_box = (bbox_width, bbox_height, bbox_dx, bbox_dy)
+        self._first_code = first_code
+        self._num_glyphs = num_glyphs
+        self._glyph_size = struct.calcsize(GLYPH_FORMAT)
+        self._glyphs_offset = struct.calcsize(HEADER_FORMAT)
+        self._bitmaps_offset = self._glyphs_offset + (num_glyphs * self._glyph_size)
+
+    def get_bounding_box(self) -> tuple:
+        return self._bounding_box
+
+    def load_glyphs(self, code_points) -> None:
+        # Every glyph is directly addressable, there is nothing to load.
+        pass
+
+    def get_glyph(self, code_point: int):
+        idx = code_point - self._first_code
+        if not (0 <= idx < self._num_glyphs):
+            return None
+
+        width, height, dx, dy, shift_x, bitmap_offset = struct.unpack_from(GLYPH_FORMAT, self._packed, self._glyphs_offset + (idx * self._glyph_size))
+        if width == MISSING_GLYPH_WIDTH:
+            return None
+
+        bitmap = PackedGlyphBitmap(self._packed, self._bitmaps_offset + bitmap_offset, width)
+        return PackedGlyph(bitmap, width, height, dx, dy, shift_x)
+
+
+def load_packed_font(filename: str) -> PackedBitmapFont:
+    with open(filename, "rb") as infile:
+        return PackedBitmapFont(infile.read())
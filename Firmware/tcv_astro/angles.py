@@ -12,6 +12,11 @@ def sin_degrees(degrees: float) -> float:
 def cos_degrees(degrees: float) -> float:
     return math.cos(deg_to_rad(degrees))
 
+def sincos_degrees(degrees: float) -> tuple[float, float]:
+    """Return (sin, cos) of `degrees`, converting to radians only once."""
+    radians = deg_to_rad(degrees)
+    return (math.sin(radians), math.cos(radians))
+
 def tan_degrees(degrees: float) -> float:
     return math.tan(deg_to_rad(degrees))
 
@@ -25,7 +30,8 @@ def atan2_degrees(num: float, denum: float) -> float:
     return rad_to_deg(math.atan2(num, denum))
 
 def signum(val: float) -> float:
-    return -1.0 if val < 0.0 else 1.0
+    """Return -1.0 for negative `val` (including -0.0, so that -0°30' keeps its sign), otherwise 1.0."""
+    return math.copysign(1.0, val)
 
 def dms_to_degrees(degrees: float=0.0, minutes: float=0.0, seconds: float=0.0) -> float:
     """Convert degrees/minutes/seconds to decimal degrees.
@@ -85,7 +91,11 @@ def degrees_to_dms(degrees: float) -> DegreesMinutesSeconds:
     return DegreesMinutesSeconds(int(degrees_sign) * int(degrees_full), int(minutes_full), seconds)
 
 def ecliptic_to_equatorial(in_lambda_degrees: float, beta_degrees: float, epsilon_degrees: float) -> tuple[float, float]:
-    alpha = atan2_degrees(((sin_degrees(in_lambda_degrees) * cos_degrees(epsilon_degrees)) - (tan_degrees(beta_degrees) * sin_degrees(epsilon_degrees))), cos_degrees(in_lambda_degrees))
-    delta = asin_degrees((sin_degrees(beta_degrees) * cos_degrees(epsilon_degrees)) + (cos_degrees(beta_degrees) * sin_degrees(epsilon_degrees) * sin_degrees(in_lambda_degrees)))
+    sin_lambda, cos_lambda = sincos_degrees(in_lambda_degrees)
+    sin_beta, cos_beta = sincos_degrees(beta_degrees)
+    sin_epsilon, cos_epsilon = sincos_degrees(epsilon_degrees)
+
+    alpha = atan2_degrees(((sin_lambda * cos_epsilon) - ((sin_beta / cos_beta) * sin_epsilon)), cos_lambda)
+    delta = asin_degrees((sin_beta * cos_epsilon) + (cos_beta * sin_epsilon * sin_lambda))
 
     return (alpha, delta)
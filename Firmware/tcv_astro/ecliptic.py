@@ -1,6 +1,29 @@
-from tcv_astro.angles import sin_degrees, cos_degrees, dms_to_degrees, degrees_to_dms
-from tcv_astro.polynomial import poly_eval
+from tcv_astro.angles import sincos_degrees, dms_to_degrees, degrees_to_dms
 from tcv_astro.julian import julian_day_to_julian_centuries, EPOCH_J2000
+from tcv_astro.utils import bounded_cache_put
+
+# Sun, moon and sidereal time computations for the same instant all need its nutations
+NUTATIONS_CACHE_SIZE = 8
+
+# Coefficients of nutation_simplified_meeus(), converted from arcseconds once at import time.
+_DELTA_PSI_OMEGA = dms_to_degrees(seconds=-17.20)
+_DELTA_PSI_2L = dms_to_degrees(seconds=-1.32)
+_DELTA_PSI_2LPRIME = dms_to_degrees(seconds=-0.23)
+_DELTA_PSI_2OMEGA = dms_to_degrees(seconds=0.21)
+
+_DELTA_EPSILON_OMEGA = dms_to_degrees(seconds=9.20)
+_DELTA_EPSILON_2L = dms_to_degrees(seconds=0.57)
+_DELTA_EPSILON_2LPRIME = dms_to_degrees(seconds=0.10)
+_DELTA_EPSILON_2OMEGA = dms_to_degrees(seconds=-0.09)
+
+# Simplified mean obliquity (equation 21.2), valid for < 2000 years from J2000.0,
+# which is OK for our purposes.
+_EPSILON0_COEFFS = (
+    dms_to_degrees(degrees=23.0, minutes=26.0, seconds=21.448), # Constant (T^0)
+    dms_to_degrees(seconds=-46.8150), # T^1
+    dms_to_degrees(seconds=-0.00059), # T^2
+    dms_to_degrees(seconds=0.001813), # T^3
+)
 
 class EclipticNutationsAndObliquity:
     """Dataclass for Ecliptic nutations and the obliquity of the ecliptic.
@@ -15,6 +38,18 @@ class EclipticNutationsAndObliquity:
         self.true_obliquity: float = true_obliquity
 
 
+# Arguments needed if we ever move to the more accurate multi-term method. I left them here because I
+# bothered to type them before I realized I didn't need them :D
+#   Mean elongation of the Moon from the Sun:
+#     D = poly_eval(T, [297.85036, 445267.111480, -0.0019142, 1.0 / 189474.0])
+#   Mean anomaly of the Sun (Earth):
+#     M = poly_eval(T, [357.52772, 35999.050340, -0.0001603, -1.0 / 300000.0])
+#   Mean anomaly of the Moon:
+#     Mprime = poly_eval(T, [134.96298, 477198.867398, 0.0086972, 1.0 / 56250.0])
+#   Moon's argument of latitude:
+#     F = poly_eval(T, [93.27191, 483202.017538, -0.0036825, 1.0 / 327270.0])
+#   Longitude of the ascending node of the Moon's mean orbit:
+#     Omega = poly_eval(T, [125.04452, -1934.136261, 0.0020708, 1.0 / 450000.0]) % 360.0
 def nutation_simplified_meeus(jd: float) -> EclipticNutationsAndObliquity:
     """Get the nutations in longitude and obliquity for a given Julian day number `jd`.
 
@@ -24,26 +59,9 @@ def nutation_simplified_meeus(jd: float) -> EclipticNutationsAndObliquity:
     """
     T: float = julian_day_to_julian_centuries(jd, epoch=EPOCH_J2000)
 
-    # The below are present for if we ever move to the more accurate multi-term method.
-    # I left them here because I bothered to type them before I realized I didn't need them :D
-    if False:
-        # Mean elongation of the Moon from the Sun
-        D = poly_eval(T, [297.85036, 445267.111480, -0.0019142, 1.0 / 189474.0])
-
-        # Mean anomaly of the Sun (Earth)
-        M = poly_eval(T, [357.52772, 35999.050340, -0.0001603, -1.0 / 300000.0])
-
-        # Mean anomaly of the Moon
-        Mprime = poly_eval(T, [134.96298, 477198.867398, 0.0086972, 1.0 / 56250.0])
-
-        # Moon's argument of latitude
-        F = poly_eval(T, [93.27191, 483202.017538, -0.0036825, 1.0 / 327270.0])
-
-        Omega = poly_eval(T, [125.04452, -1934.136261, 0.0020708, 1.0 / 450000.0]) % 360.0
-
     # Longitude of the ascending node of the Moon's mean orbit on the
     # ecliptic, measured from the mean equinox of the date.
-    Omega = poly_eval(T, [125.04452, -1934.136261]) % 360.0
+    Omega = (125.04452 + (-1934.136261 * T)) % 360.0
 
     # Mean longitude of the Sun
     L = (280.4465 + (36000.7698 * T)) % 360.0
@@ -51,31 +69,32 @@ def nutation_simplified_meeus(jd: float) -> EclipticNutationsAndObliquity:
     # Mean longitude of the Moon
     Lprime = (218.3165 + (481267.8813 * T)) % 360.0
 
+    # The same four angles appear in both nutation series
+    sin_omega, cos_omega = sincos_degrees(Omega)
+    sin_2l, cos_2l = sincos_degrees(2 * L)
+    sin_2lprime, cos_2lprime = sincos_degrees(2 * Lprime)
+    sin_2omega, cos_2omega = sincos_degrees(2 * Omega)
+
     # Nutation in longitude
-    delta_psi = dms_to_degrees(seconds=-17.20) * sin_degrees(Omega)
-    delta_psi += dms_to_degrees(seconds=-1.32) * sin_degrees(2 * L)
-    delta_psi += dms_to_degrees(seconds=-0.23) * sin_degrees(2 * Lprime)
-    delta_psi += dms_to_degrees(seconds=0.21) * sin_degrees(2 * Omega)
+    delta_psi = _DELTA_PSI_OMEGA * sin_omega
+    delta_psi += _DELTA_PSI_2L * sin_2l
+    delta_psi += _DELTA_PSI_2LPRIME * sin_2lprime
+    delta_psi += _DELTA_PSI_2OMEGA * sin_2omega
     delta_psi %= 360.0
     delta_psi = (360.0 - delta_psi) if delta_psi > 180.0 else delta_psi
 
     # Nutation in obliquity
-    delta_epsilon = dms_to_degrees(seconds=9.20) * cos_degrees(Omega)
-    delta_epsilon += dms_to_degrees(seconds=0.57) * cos_degrees(2 * L)
-    delta_epsilon += dms_to_degrees(seconds=0.10) * cos_degrees(2 * Lprime)
-    delta_epsilon += dms_to_degrees(seconds=-0.09) * cos_degrees(2 * Omega)
+    delta_epsilon = _DELTA_EPSILON_OMEGA * cos_omega
+    delta_epsilon += _DELTA_EPSILON_2L * cos_2l
+    delta_epsilon += _DELTA_EPSILON_2LPRIME * cos_2lprime
+    delta_epsilon += _DELTA_EPSILON_2OMEGA * cos_2omega
     delta_epsilon %= 360.0
     delta_epsilon = (360.0 - delta_epsilon) if delta_epsilon > 180.0 else delta_epsilon
 
-    # Simplified mean obliquity (equation 21.2), valid for < 2000 years from J2000.0,
-    # which is OK for our purposes.
-    epsilon_coeffs = [
-        dms_to_degrees(degrees=23.0, minutes=26.0, seconds=21.448), # Constant (T^0)
-        dms_to_degrees(seconds=-46.8150), # T^1
-        dms_to_degrees(seconds=-0.00059), # T^2
-        dms_to_degrees(seconds=0.001813), # T^3
-    ]
-    epsilon0 = poly_eval(T, epsilon_coeffs) % 360.0
+    # Simplified mean obliquity (equation 21.2)
+    # Same as poly_eval(T, _EPSILON0_COEFFS), unrolled
+    c0, c1, c2, c3 = _EPSILON0_COEFFS
+    epsilon0 = (c0 + ((c1 + ((c2 + (c3 * T)) * T)) * T)) % 360.0
 
     # True obliquity
     epsilon = (epsilon0 + delta_epsilon) % 360.
@@ -88,5 +107,16 @@ def nutation_simplified_meeus(jd: float) -> EclipticNutationsAndObliquity:
 
     return EclipticNutationsAndObliquity(nutation_longitude=delta_psi, nutation_obliquity=delta_epsilon, true_obliquity=epsilon)
 
+_nutations_cache: dict = {}
+
+
 def nutations_and_obliquity(jd: float) -> EclipticNutationsAndObliquity:
-    return nutation_simplified_meeus(jd)
+    """Same as nutation_simplified_meeus(), cached for the last few `jd` looked up.
+
+    Callers working on the same instant pass the exact same `jd`, so it is used as-is for the key.
+    """
+    nutations = _nutations_cache.get(jd)
+    if nutations is None:
+        nutations = nutation_simplified_meeus(jd)
+        bounded_cache_put(_nutations_cache, jd, nutations, NUTATIONS_CACHE_SIZE)
+    return nutations
@@ -1,5 +1,5 @@
 from tcv_astro.sidereal import sidereal_time_at_greenwhich
-from tcv_astro.angles import acos_degrees, asin_degrees, sin_degrees, cos_degrees, dms_to_degrees
+from tcv_astro.angles import acos_degrees, asin_degrees, sin_degrees, sincos_degrees, dms_to_degrees
 from tcv_astro.sun import solar_coordinates, SolarCoordinates
 from tcv_astro.moon import lunar_coordinates, LunarCoordinates
 from tcv_astro.julian import TT_UT_DIFFERENCE_SECONDS_2017
@@ -14,6 +14,9 @@ try:
 except ImportError:
     Optional = 'Optional'
 
+# Moon's standard altitude ho is 0.7275 * parallax - 34' (Meeus, chapter 15)
+_MOON_HO_REFRACTION_DEGREES = dms_to_degrees(minutes=34)
+
 class ObjectPositions:
     def __init__(self, prev_day_ra_apparent: float, prev_day_dec_apparent: float, cur_day_ra_apparent: float, cur_day_dec_apparent: float, next_day_ra_apparent: float, next_day_dec_apparent: float, ho_degrees: float=-0.5667):
         self.prev_day_ra_apparent: float = prev_day_ra_apparent
@@ -33,11 +36,7 @@ class RiseTransitSetTimes:
         self.next_set_time_hours: float = next_set_time_hours
 
 
-def get_moon_positions_for_event(jd: float) -> ObjectPositions:
-    prev_day: LunarCoordinates = lunar_coordinates(jd - 1.0)
-    cur_day: LunarCoordinates = lunar_coordinates(jd)
-    next_day: LunarCoordinates = lunar_coordinates(jd + 1.0)
-
+def _moon_positions(prev_day: LunarCoordinates, cur_day: LunarCoordinates, next_day: LunarCoordinates) -> ObjectPositions:
     return ObjectPositions(
         prev_day_ra_apparent = prev_day.ra_apparent,
         prev_day_dec_apparent = prev_day.dec_apparent,
@@ -45,15 +44,11 @@ def get_moon_positions_for_event(jd: float) -> ObjectPositions:
         cur_day_dec_apparent = cur_day.dec_apparent,
         next_day_ra_apparent = next_day.ra_apparent,
         next_day_dec_apparent = next_day.dec_apparent,
-        ho_degrees = (0.7275 * cur_day.horizontal_parallax_degrees) - dms_to_degrees(minutes=34)
+        ho_degrees = (0.7275 * cur_day.horizontal_parallax_degrees) - _MOON_HO_REFRACTION_DEGREES
     )
 
 
-def get_sun_positions_for_event(jd: float) -> ObjectPositions:
-    prev_day: SolarCoordinates = solar_coordinates(jd - 1.0)
-    cur_day:  SolarCoordinates = solar_coordinates(jd)
-    next_day: SolarCoordinates = solar_coordinates(jd + 1.0)
-
+def _sun_positions(prev_day: SolarCoordinates, cur_day: SolarCoordinates, next_day: SolarCoordinates) -> ObjectPositions:
     return ObjectPositions(
         prev_day_ra_apparent = prev_day.ra_apparent,
         prev_day_dec_apparent = prev_day.dec_apparent,
@@ -65,6 +60,46 @@ def get_sun_positions_for_event(jd: float) -> ObjectPositions:
     )
 
 
+def get_moon_positions_for_event(jd: float) -> ObjectPositions:
+    return _moon_positions(lunar_coordinates(jd - 1.0), lunar_coordinates(jd), lunar_coordinates(jd + 1.0))
+
+
+def get_sun_positions_for_event(jd: float) -> ObjectPositions:
+    return _sun_positions(solar_coordinates(jd - 1.0), solar_coordinates(jd), solar_coordinates(jd + 1.0))
+
+
+class PositionsWindow:
+    """Object positions for days around `jd`, computed on demand.
+
+    Adjacent days share their neighbours' coordinates, so each day's coordinates are only computed once,
+    whichever days end up being asked for.
+    """
+    def __init__(self, jd: float, coordinates_func, positions_func):
+        self.jd: float = jd
+        self._coordinates_func = coordinates_func
+        self._positions_func = positions_func
+        self._coordinates: dict = {}
+
+    def _coordinates_for_day(self, day_offset: int):
+        coordinates = self._coordinates.get(day_offset)
+        if coordinates is None:
+            coordinates = self._coordinates_func(self.jd + day_offset)
+            self._coordinates[day_offset] = coordinates
+        return coordinates
+
+    def positions(self, day_offset: int) -> ObjectPositions:
+        """Same as get_*_positions_for_event(jd + day_offset)."""
+        return self._positions_func(self._coordinates_for_day(day_offset - 1), self._coordinates_for_day(day_offset), self._coordinates_for_day(day_offset + 1))
+
+
+def get_moon_positions_window(jd: float) -> PositionsWindow:
+    return PositionsWindow(jd, lunar_coordinates, _moon_positions)
+
+
+def get_sun_positions_window(jd: float) -> PositionsWindow:
+    return PositionsWindow(jd, solar_coordinates, _sun_positions)
+
+
 def interpolate(y1: float, y2: float, y3: float, n: float) -> float:
     """Interpolate a normalized interval `n` around y2, with y1 and y3 being same tabular distance.
 
@@ -79,6 +114,43 @@ def interpolate(y1: float, y2: float, y3: float, n: float) -> float:
     return y2 + ((n / 2.0) * (a + b + (n * c)))
 
 
+def _get_interpolated_time(initial_m: float, is_transit: bool, theta0: float, delta_t_days: float, alpha2: float, alpha_ab: float, alpha_c: float, delta2: float, delta_ab: float, delta_c: float, sin_lat: float, cos_lat: float, obs_lon_degrees: float, ho_degrees: float) -> float:
+    """Corrected event time in hours for a get_event_time() fraction of day `initial_m`.
+
+    All the state is passed in explicitly rather than captured, so no closure is built per get_event_time() call.
+    `sin_lat` and `cos_lat` are the sine and cosine of the observer latitude, which are the same for every event.
+    `*_ab` and `*_c` are the (a + b) and c differences of interpolate(), which only depend on the tabular values.
+
+    Reference:
+        Meeus, J. (1991). Astronomical algorithms (1st ed.). Willmann-Bell". Chapter 15.
+    """
+    theta = (theta0 + (360.985647 * initial_m)) % 360.0
+
+    n = initial_m + delta_t_days
+    # Same as interpolate(), inlined with the differences precomputed
+    half_n = n / 2.0
+    # Interpolated apparent right ascension
+    alpha = alpha2 + (half_n * (alpha_ab + (n * alpha_c)))
+    # Interpolated apparent declination
+    delta = delta2 + (half_n * (delta_ab + (n * delta_c)))
+
+    # Local hour angle
+    H = (theta - obs_lon_degrees - alpha)
+
+    if is_transit:
+        delta_m = -H / 360.0
+    else:
+        sin_delta, cos_delta = sincos_degrees(delta)
+        sin_H, cos_H = sincos_degrees(H)
+        # Body's local altitude per Meeus eq. 12.6
+        h = asin_degrees(((sin_lat * sin_delta) + (cos_lat * cos_delta * cos_H)))
+        delta_m = (h - ho_degrees) / (360.0 * cos_delta * cos_lat * sin_H)
+
+    m_corrected = initial_m + delta_m
+    hours = (m_corrected * 24.0) % 24.0
+    return hours
+
+
 def get_event_time(jd: float, object_positions: ObjectPositions, obs_lat_degrees: float, obs_lon_degrees: float, delta_t: float=TT_UT_DIFFERENCE_SECONDS_2017) -> Optional[RiseTransitSetTimes]:
     alpha1, delta1 = object_positions.prev_day_ra_apparent, object_positions.prev_day_dec_apparent
     alpha2, delta2 = object_positions.cur_day_ra_apparent, object_positions.cur_day_dec_apparent
@@ -86,7 +158,10 @@ def get_event_time(jd: float, object_positions: ObjectPositions, obs_lat_degrees
     ho_degrees = object_positions.ho_degrees
 
     theta0 = sidereal_time_at_greenwhich(jd)
-    Ho_arg = ((sin_degrees(ho_degrees) - (sin_degrees(obs_lat_degrees) * sin_degrees(delta2))) / (cos_degrees(obs_lat_degrees) * cos_degrees(delta2)))
+    # Observer latitude terms are shared by Ho and every interpolated event time
+    sin_lat, cos_lat = sincos_degrees(obs_lat_degrees)
+    sin_delta2, cos_delta2 = sincos_degrees(delta2)
+    Ho_arg = ((sin_degrees(ho_degrees) - (sin_lat * sin_delta2)) / (cos_lat * cos_delta2))
 
     # No rise/set times (always or never visible)
     if abs(Ho_arg) > 1.0:
@@ -95,14 +170,28 @@ def get_event_time(jd: float, object_positions: ObjectPositions, obs_lat_degrees
     Ho = acos_degrees(Ho_arg)
     assert Ho >= 0.0 and Ho <= 180.0
 
+    # Differences for interpolating RA/declination, which are the same for every event (see interpolate())
+    alpha_a = alpha2 - alpha1
+    alpha_b = alpha3 - alpha2
+    delta_a = delta2 - delta1
+    delta_b = delta3 - delta2
+    alpha_ab, alpha_c = alpha_a + alpha_b, alpha_b - alpha_a
+    delta_ab, delta_c = delta_a + delta_b, delta_b - delta_a
+
+    # TT - UT difference, as a fraction of a day
+    delta_t_days = delta_t / 86400.0
+
     # Transit
     mo = ((alpha2 + obs_lon_degrees - theta0) / 360.0)
 
+    # Hour angle as a fraction of a day, shared by rising and setting
+    Ho_days = Ho / 360.0
+
     # Rising
-    m1 = (mo - (Ho / 360.0))
+    m1 = (mo - Ho_days)
 
     # Setting
-    m2 = (mo + (Ho / 360.0))
+    m2 = (mo + Ho_days)
 
     # print(f'{m1:.3f} {mo:.3f} {m2:.13f}')
 
@@ -115,37 +204,13 @@ def get_event_time(jd: float, object_positions: ObjectPositions, obs_lat_degrees
     #     compute_next_set = True
     #     m2 -= 1.0
 
-    def get_interpolated_time(initial_m: float, is_transit: bool) -> float:
-        theta = (theta0 + (360.985647 * initial_m)) % 360.0
-
-        n = initial_m + (delta_t / 86400.0)
-        # Interpolated apparent right ascension
-        alpha = interpolate(alpha1, alpha2, alpha3, n)
-        # Interpolated apparent declination
-        delta = interpolate(delta1, delta2, delta3, n)
-
-        # Local hour angle
-        H = (theta - obs_lon_degrees - alpha)
-
-        # Body's local altitude per Meeus eq. 12.6
-        h = asin_degrees(((sin_degrees(obs_lat_degrees) * sin_degrees(delta)) + (cos_degrees(obs_lat_degrees) * cos_degrees(delta) * cos_degrees(H))))
-
-        if is_transit:
-            delta_m = -H / 360.0
-        else:
-            delta_m = (h - ho_degrees) / (360.0 * cos_degrees(delta) * cos_degrees(obs_lat_degrees) * sin_degrees(H))
-
-        m_corrected = initial_m + delta_m
-        hours = (m_corrected * 24.0) % 24.0
-        return hours
-
-    rising_time = get_interpolated_time(m1, is_transit=False)
-    transit_time = get_interpolated_time(mo, is_transit=True)
-    setting_time = get_interpolated_time(m2, is_transit=False)
+    rising_time = _get_interpolated_time(m1, False, theta0, delta_t_days, alpha2, alpha_ab, alpha_c, delta2, delta_ab, delta_c, sin_lat, cos_lat, obs_lon_degrees, ho_degrees)
+    transit_time = _get_interpolated_time(mo, True, theta0, delta_t_days, alpha2, alpha_ab, alpha_c, delta2, delta_ab, delta_c, sin_lat, cos_lat, obs_lon_degrees, ho_degrees)
+    setting_time = _get_interpolated_time(m2, False, theta0, delta_t_days, alpha2, alpha_ab, alpha_c, delta2, delta_ab, delta_c, sin_lat, cos_lat, obs_lon_degrees, ho_degrees)
 
     compute_next_set = False
     next_setting_time = None
     if compute_next_set:
-        next_setting_time = get_interpolated_time(m2 + 1.0, is_transit=False)
+        next_setting_time = _get_interpolated_time(m2 + 1.0, False, theta0, delta_t_days, alpha2, alpha_ab, alpha_c, delta2, delta_ab, delta_c, sin_lat, cos_lat, obs_lon_degrees, ho_degrees)
 
     return RiseTransitSetTimes(rise_time_hours=rising_time, transit_time_hours=transit_time, set_time_hours=setting_time, next_set_time_hours=next_setting_time)
@@ -1,4 +1,3 @@
-import math
 try:
     from ucollections import namedtuple
 except ImportError:
@@ -55,10 +54,19 @@ def date_to_julian_day(year: int, month: int, day: float) -> float:
 
     Algorithm is from:
      - Meeus, J. (1991). Astronomical algorithms (1st ed.). Willmann-Bell. Chap 7.
+     - Fliegel, H. F., Van Flandern, T. C. (1968). Communications of the ACM 11(10), 657, for years after 1582.
     """
 
+    if year > 1582:
+        # Always Gregorian: integer-only form of the julian day number at noon of day 0 of the month,
+        # which gives the same result as the general form below without float truncations or branches.
+        # m14 is (month - 14) / 12 truncated toward zero, as in the original.
+        m14: int = -1 if month < 3 else 0
+        jdn0: int = ((1461 * (year + 4800 + m14)) // 4) + ((367 * (month - 2 - (12 * m14))) // 12) - ((3 * ((year + 4900 + m14) // 100)) // 4) - 32075
+        return (jdn0 + day) - 0.5
+
     # January/February are treated as the 13th and 14th month for the algorithm below.
-    if month in [1, 2]:
+    if month < 3:
         year = year - 1
         month = month + 12
 
@@ -86,9 +94,8 @@ def julian_day_to_date(jd: float) -> FractionalDate:
         raise ValueError("Only positive Julian days supported")
 
     jd += 0.5
-    fractional_part, integer_part = math.modf(jd)
-    z: int = int(integer_part)
-    f: float = fractional_part
+    z: int = int(jd)
+    f: float = jd - z
 
     if z < 2299161:
         a: int = z
@@ -1,18 +1,17 @@
 
 from tcv_astro import julian
-from tcv_astro.polynomial import poly_eval
-from tcv_astro.angles import sin_degrees, cos_degrees, asin_degrees, atan2_degrees, degrees_to_hms, degrees_to_dms, ecliptic_to_equatorial
-from tcv_astro.ecliptic import nutation_simplified_meeus
-from tcv_astro.utils import package_relpath
+from tcv_astro.angles import deg_to_rad, sin_degrees, cos_degrees, asin_degrees, atan2_degrees, degrees_to_hms, degrees_to_dms, ecliptic_to_equatorial
+from tcv_astro.ecliptic import nutations_and_obliquity
+from tcv_astro.utils import package_relpath, cache_jd_key, bounded_cache_put, JD_CACHE_SIZE
 from tcv_astro.sun import solar_coordinates_low_accuracy_meeus
+import math
 import struct
-from io import BytesIO
+from array import array
 
 # Give us a chance to run GC on circuitpython
 try:
     import gc
-    def run_gc():
-        gc.collect()
+    run_gc = gc.collect
 except:
     def run_gc():
         pass
@@ -41,60 +40,164 @@ TBL_IDX_SIGMA1 = 0
 TBL_IDX_SIGMAR = 1
 TBL_IDX_SIGMAB = 2
 
+# Layout of table45.bin, see parse_table45()
+TABLE45_MAGIC = 0x7ab45000
+TABLE45_HEADER_FORMAT = "<IB"
+TABLE45_COUNT_FORMAT = "<H"
+TABLE45_ENTRY_FORMAT = "<bbbbi"
+TABLE45_HEADER_SIZE = struct.calcsize(TABLE45_HEADER_FORMAT)
+TABLE45_COUNT_SIZE = struct.calcsize(TABLE45_COUNT_FORMAT)
+TABLE45_ENTRY_SIZE = struct.calcsize(TABLE45_ENTRY_FORMAT)
+
+# Coefficients in T of the polynomials in lunar_coordinates_high_accuracy_meeus(), see poly_eval()
+_LPRIME_COEFFS = (218.3164591, 481267.88134236, -0.0013268, 1.0 / 538851.0, -1.0 / 65194000.0)
+_D_COEFFS = (297.8502042, 445267.1115168, -0.0016300, 1.0 / 545868.0, -1.0 / 113065000.0)
+_M_COEFFS = (357.5291092, 35999.0502909, -0.0001536, 1.0 / 24490000.0)
+_MPRIME_COEFFS = (134.9634114, 477198.8676313, 0.0089970, 1.0 / 69699.0, -1.0 / 14712000.0)
+_F_COEFFS = (93.2720993, 483202.0175273, -0.0034029, -1.0 / 3526000, 1.0 / 863310000.0)
+_E_COEFFS = (1.0, -0.002516, -0.0000074)
+
+
+class Table45Column:
+    def __init__(self, num_rows: int):
+        """One column of Table 45 A/B, as parallel arrays with one entry per row.
+
+        Compact arrays rather than a tuple per row: no per-row objects on the heap, and reading an entry
+        yields a small int without allocating.
+
+        - d, m, mprime, f --> multiples of D, M, Mprime and F in the row's argument
+        - coeff --> coefficient of the row's sine/cosine term
+        - m_group_ends --> rows are grouped by |M| (0, 1 then 2), group i ends before row m_group_ends[i]
+        """
+        self.num_rows = num_rows
+        self.m_group_ends = (num_rows, num_rows, num_rows)
+        self.d = array("b", bytes(num_rows))
+        self.m = array("b", bytes(num_rows))
+        self.mprime = array("b", bytes(num_rows))
+        self.f = array("b", bytes(num_rows))
+        self.coeff = array("i", [0] * num_rows)
 
-def sum_table45(table45_bytes: bytes, table_idx: int, m_corrector: callable, D: float, M: float, Mprime: float, F: float) -> float:
-    """Computes the sum from one of the columns of Table 45 A/B from Meeus.
 
-    - table45_bytes --> content of specially encoded packed binary file (see scripts/convert_table45.py
-    - table_idx --> which of the table/columns to add
-    - m_corrector --> callable with (M) that applies a correction factor when M !=0 in a row
-    - D, M, Mprime, F --> base values to apply to the factors of the table
+def parse_table45(table45_bytes: bytes) -> tuple:
+    """Decode the Table 45 A/B columns into (sigma1, sigmar, sigmab) Table45Column's, indexed by TBL_IDX_*.
 
-    Reference:
-        Meeus, J. (1991). Astronomical algorithms (1st ed.). Willmann-Bell". Chapter 45.
+    - table45_bytes --> content of specially encoded packed binary file (see scripts/convert_table45.py
 
     Tables re-entered by hand by the author, from the book.
     """
-    TABLE45_MAGIC = 0x7ab45000
-    header_format = "<IB"
-    entry_format = "<bbbbi"
+    magic, num_tables = struct.unpack_from(TABLE45_HEADER_FORMAT, table45_bytes, 0)
+    if magic != TABLE45_MAGIC or num_tables <= TBL_IDX_SIGMAB:
+        raise ValueError("Wrong table45 format")
+
+    offset = TABLE45_HEADER_SIZE
+    columns = []
+    for _ in range(TBL_IDX_SIGMAB + 1):
+        num_items = struct.unpack_from(TABLE45_COUNT_FORMAT, table45_bytes, offset)[0]
+        offset += TABLE45_COUNT_SIZE
+
+        # Reorder the rows by |M|, so that the sums apply each E correction once per group rather than per row.
+        column = Table45Column(num_items)
+        row_idx = 0
+        m_group_ends = []
+        for abs_M in range(3):
+            for item_idx in range(num_items):
+                M_D, M_M, M_Mprime, M_F, coeff = struct.unpack_from(TABLE45_ENTRY_FORMAT, table45_bytes, offset + (item_idx * TABLE45_ENTRY_SIZE))
+                if abs(M_M) != abs_M:
+                    continue
+                column.d[row_idx] = M_D
+                column.m[row_idx] = M_M
+                column.mprime[row_idx] = M_Mprime
+                column.f[row_idx] = M_F
+                column.coeff[row_idx] = coeff
+                row_idx += 1
+            m_group_ends.append(row_idx)
+
+        if row_idx != num_items:
+            raise ValueError("Wrong table45 M multiple")
+
+        column.m_group_ends = tuple(m_group_ends)
+        offset += num_items * TABLE45_ENTRY_SIZE
+        columns.append(column)
+
+    # Table 45.A lists Sigma1 and SigmaR against the same arguments, so they are summed in one pass
+    # by sum_table45_sines_and_cosines(), and can share the multiples.
+    sigma1_column, sigmar_column = columns[TBL_IDX_SIGMA1], columns[TBL_IDX_SIGMAR]
+    if (sigma1_column.d != sigmar_column.d or sigma1_column.m != sigmar_column.m or
+            sigma1_column.mprime != sigmar_column.mprime or sigma1_column.f != sigmar_column.f):
+        raise ValueError("Sigma1 and SigmaR rows of table45 differ")
+    sigmar_column.d, sigmar_column.m, sigmar_column.mprime, sigmar_column.f = sigma1_column.d, sigma1_column.m, sigma1_column.mprime, sigma1_column.f
+
+    return tuple(columns)
+
 
-    assert table_idx <= TBL_IDX_SIGMAB
-    with BytesIO(table45_bytes) as infile:
-        magic, num_tables = struct.unpack(header_format, infile.read(struct.calcsize(header_format)))
-        if magic != TABLE45_MAGIC or table_idx >= num_tables:
-            raise ValueError("Wrong table45 format")
+# Decoded Table 45, loaded on first use by _load_table45()
+_table45 = None
 
-        to_skip = table_idx
 
-        entry_size = struct.calcsize(entry_format)
+def _load_table45() -> tuple:
+    global _table45
 
-        for load_idx in range(table_idx + 1):
-            num_items = struct.unpack("<H", infile.read(2))[0]
-            if load_idx < to_skip:
-                infile.read(num_items * entry_size)
-                continue
+    if _table45 is None:
+        with open(package_relpath(__file__, "table45.bin"), "rb") as infile:
+            _table45 = parse_table45(infile.read())
+        # The file contents are garbage once decoded.
+        run_gc()
 
-            final_sum = 0.0
-            for _ in range(num_items):
-                row = struct.unpack(entry_format, infile.read(entry_size))
-                M_D: int = row[0]
-                M_M: int = row[1]
-                M_Mprime: int = row[2]
-                M_F: int = row[3]
-                coeff: float = float(row[4])
+    return _table45
 
-                m_factor = m_corrector(M_M)
-                trig_arg = (M_D * D) + (M_M * M) + (M_Mprime * Mprime) + (M_F * F)
 
-                if (table_idx == TBL_IDX_SIGMAR):
-                    trig_val = cos_degrees(trig_arg % 360.0)
-                else:
-                    trig_val = sin_degrees(trig_arg % 360.0)
+def sum_table45_sines(column: Table45Column, m_factors: tuple, D: float, M: float, Mprime: float, F: float) -> float:
+    """Computes the sum of sines from one of the columns of Table 45 A/B from Meeus (SigmaB).
 
-                final_sum += (m_factor * coeff * trig_val)
+    - column --> one of the columns from parse_table45()
+    - m_factors --> correction factor for rows by M multiple, indexed by |M| (M is within [-2, 2])
+    - D, M, Mprime, F --> base values to apply to the factors of the table, in radians
 
-            return final_sum
+    Sigma1 is summed along with SigmaR by sum_table45_sines_and_cosines(). Taking the base values in radians
+    means each row goes straight to math.sin, without a degrees conversion.
+
+    Reference:
+        Meeus, J. (1991). Astronomical algorithms (1st ed.). Willmann-Bell". Chapter 45.
+    """
+    sin = math.sin
+    d, m, mprime, f, coeff = column.d, column.m, column.mprime, column.f, column.coeff
+    final_sum = 0.0
+    start_idx = 0
+    for abs_M, end_idx in enumerate(column.m_group_ends):
+        group_sum = 0.0
+        for idx in range(start_idx, end_idx):
+            trig_arg = (d[idx] * D) + (m[idx] * M) + (mprime[idx] * Mprime) + (f[idx] * F)
+            group_sum += coeff[idx] * sin(trig_arg)
+        final_sum += m_factors[abs_M] * group_sum
+        start_idx = end_idx
+
+    return final_sum
+
+
+def sum_table45_sines_and_cosines(sine_column: Table45Column, cosine_column: Table45Column, m_factors: tuple, D: float, M: float, Mprime: float, F: float) -> tuple[float, float]:
+    """Computes (sum of sines, sum of cosines) for two columns of Table 45 A/B with the same arguments (Sigma1 and SigmaR).
+
+    See sum_table45_sines() for the arguments. Each row's argument is only computed once, for both sums.
+    """
+    sin = math.sin
+    cos = math.cos
+    d, m, mprime, f = sine_column.d, sine_column.m, sine_column.mprime, sine_column.f
+    sine_coeff, cosine_coeff = sine_column.coeff, cosine_column.coeff
+    sine_sum = 0.0
+    cosine_sum = 0.0
+    start_idx = 0
+    for abs_M, end_idx in enumerate(sine_column.m_group_ends):
+        group_sine_sum = 0.0
+        group_cosine_sum = 0.0
+        for idx in range(start_idx, end_idx):
+            trig_arg = (d[idx] * D) + (m[idx] * M) + (mprime[idx] * Mprime) + (f[idx] * F)
+            group_sine_sum += sine_coeff[idx] * sin(trig_arg)
+            group_cosine_sum += cosine_coeff[idx] * cos(trig_arg)
+        sine_sum += m_factors[abs_M] * group_sine_sum
+        cosine_sum += m_factors[abs_M] * group_cosine_sum
+        start_idx = end_idx
+
+    return sine_sum, cosine_sum
 
 
 def lunar_coordinates_high_accuracy_meeus(jd: float) -> LunarCoordinates:
@@ -107,51 +210,47 @@ def lunar_coordinates_high_accuracy_meeus(jd: float) -> LunarCoordinates:
     T = julian.julian_day_to_julian_centuries(jd, epoch=julian.EPOCH_J2000)
 
     # Mean longitude of the moon
-    Lprime = poly_eval(T, [218.3164591, 481267.88134236, -0.0013268, 1.0 / 538851.0, -1.0 / 65194000.0]) % 360.0
+    c0, c1, c2, c3, c4 = _LPRIME_COEFFS
+    Lprime = (c0 + ((c1 + ((c2 + ((c3 + (c4 * T)) * T)) * T)) * T)) % 360.0
 
     # Mean elongation of the moon
-    D = poly_eval(T, [297.8502042, 445267.1115168, -0.0016300, 1.0 / 545868.0, -1.0 / 113065000.0]) % 360.0
+    c0, c1, c2, c3, c4 = _D_COEFFS
+    D = (c0 + ((c1 + ((c2 + ((c3 + (c4 * T)) * T)) * T)) * T)) % 360.0
 
     # Mean anomaly of the sun
-    M = poly_eval(T, [357.5291092, 35999.0502909, -0.0001536, 1.0 / 24490000.0]) % 360.0
+    c0, c1, c2, c3 = _M_COEFFS
+    M = (c0 + ((c1 + ((c2 + (c3 * T)) * T)) * T)) % 360.0
 
     # Mean anomaly of the moon
-    Mprime = poly_eval(T, [134.9634114, 477198.8676313, 0.0089970, 1.0 / 69699.0, -1.0 / 14712000.0]) % 360.0
+    c0, c1, c2, c3, c4 = _MPRIME_COEFFS
+    Mprime = (c0 + ((c1 + ((c2 + ((c3 + (c4 * T)) * T)) * T)) * T)) % 360.0
 
     # Moon's argument of latitude (mean distance of the moon from its ascending node)
-    F = poly_eval(T, [93.2720993, 483202.0175273, -0.0034029, -1.0 / 3526000, 1.0 / 863310000.0]) % 360.0
+    c0, c1, c2, c3, c4 = _F_COEFFS
+    F = (c0 + ((c1 + ((c2 + ((c3 + (c4 * T)) * T)) * T)) * T)) % 360.0
 
     # Other needed arguments for the corrections
     A1 = (119.75 + (131.849 * T)) % 360.0
     A2 = (53.09 + (479264.290 * T)) % 360.0
     A3 = (313.45 + (481266.484 * T)) % 360.0
-    E = poly_eval(T, [1.0, -0.002516, -0.0000074])
+    c0, c1, c2 = _E_COEFFS
+    E = c0 + ((c1 + (c2 * T)) * T)
 
-    def m_corrector(M: int) -> float:
-        if abs(M) == 1:
-            return E
-        elif abs(M) == 2:
-            return E * E
-        else:
-            return 1.0
+    # Rows with M = +/-1 are corrected by E, and by E^2 for M = +/-2, indexed by |M|.
+    m_factors = (1.0, E, E * E)
 
-    with open(package_relpath(__file__, "table45.bin"), "rb") as infile:
-        table45_bytes = infile.read()
+    sigma1_column, sigmar_column, sigmab_column = _load_table45()
+    D_rad, M_rad, Mprime_rad, F_rad = deg_to_rad(D), deg_to_rad(M), deg_to_rad(Mprime), deg_to_rad(F)
 
     # The sums Sigma1, SigmaR, SigmaB are the core values used by the algorithm.
-    sigma1 = sum_table45(table45_bytes, TBL_IDX_SIGMA1, m_corrector, D, M, Mprime, F)
-    sigma1 += (3958.0 * sin_degrees(A1)) + (1962.0 * sin_degrees(Lprime - F)) + (318.0 * sin_degrees(A2))
-    run_gc()
-
-    sigmar = sum_table45(table45_bytes, TBL_IDX_SIGMAR, m_corrector, D, M, Mprime, F)
+    sigma1, sigmar = sum_table45_sines_and_cosines(sigma1_column, sigmar_column, m_factors, D_rad, M_rad, Mprime_rad, F_rad)
+    sin_A1 = sin_degrees(A1)
+    sigma1 += (3958.0 * sin_A1) + (1962.0 * sin_degrees(Lprime - F)) + (318.0 * sin_degrees(A2))
 
-    sigmab = sum_table45(table45_bytes, TBL_IDX_SIGMAB, m_corrector, D, M, Mprime, F)
-    sigmab += (-2235.0 * sin_degrees(Lprime)) + (382.0 * sin_degrees(A3)) + (175.0 * sin_degrees(A1 - F))
-    sigmab += (175.0 * sin_degrees(A1 + F)) + (127.0 * sin_degrees(Lprime - Mprime)) - (115.0 * sin_degrees(Lprime + Mprime))
-
-    # Make the big blob garbage-collectable once done.
-    table45_bytes = None
-    run_gc()
+    sigmab = sum_table45_sines(sigmab_column, m_factors, D_rad, M_rad, Mprime_rad, F_rad)
+    # 175 * (sin(A1 - F) + sin(A1 + F)) == 350 * sin(A1) * cos(F), reusing sin(A1) from Sigma1.
+    sigmab += (-2235.0 * sin_degrees(Lprime)) + (382.0 * sin_degrees(A3)) + (350.0 * sin_A1 * cos_degrees(F))
+    sigmab += (127.0 * sin_degrees(Lprime - Mprime)) - (115.0 * sin_degrees(Lprime + Mprime))
 
     # Geocentric latitude of the center of the moon
     moon_lambda = (Lprime + (sigma1 / 1e6)) % 360.0
@@ -168,7 +267,7 @@ def lunar_coordinates_high_accuracy_meeus(jd: float) -> LunarCoordinates:
         moon_pi = moon_pi - 360.0
 
     # TODO: Re-check accuracy to the book after moving to using accurate nutations from chap 21, not simplified
-    nutation = nutation_simplified_meeus(jd)
+    nutation = nutations_and_obliquity(jd)
     apparent_lambda = moon_lambda + nutation.nutation_longitude
 
     ra_apparent, dec_apparent = ecliptic_to_equatorial(apparent_lambda, beta, epsilon_degrees=nutation.true_obliquity)
@@ -176,8 +275,17 @@ def lunar_coordinates_high_accuracy_meeus(jd: float) -> LunarCoordinates:
     return LunarCoordinates(true_lon=moon_lambda, ra_apparent=ra_apparent, dec_apparent=dec_apparent, horizontal_parallax_degrees=moon_pi, distance_km=delta)
 
 
+_lunar_coordinates_cache: dict = {}
+
+
 def lunar_coordinates(jd: float) -> LunarCoordinates:
-    return lunar_coordinates_high_accuracy_meeus(jd)
+    """Same as lunar_coordinates_high_accuracy_meeus(), cached."""
+    key = cache_jd_key(jd)
+    coordinates = _lunar_coordinates_cache.get(key)
+    if coordinates is None:
+        coordinates = lunar_coordinates_high_accuracy_meeus(jd)
+        bounded_cache_put(_lunar_coordinates_cache, key, coordinates, JD_CACHE_SIZE)
+    return coordinates
 
 
 def lunar_age_normalized_28_days(jd: float) -> float:
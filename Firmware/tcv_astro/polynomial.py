@@ -1,8 +1,15 @@
 def poly_eval(x: float, coefficients: list[float]) -> float:
-    """Horner method evaluation of polynomial at x, where coefficients are from a[0] to a[degree-1]."""
-    result = coefficients[-1]
-    for coefficient in coefficients[-2::-1]:
-        result = coefficient + (result * x)
+    """Horner method evaluation of polynomial at x, where coefficients are from a[0] to a[degree-1].
+
+    The fixed-degree polynomials of tcv_astro keep their coefficients in `_*_COEFFS` tuples in this order, and
+    unroll this same evaluation inline to skip the call and loop.
+    """
+    # Index backwards rather than iterating a reversed slice, which would allocate a list per call.
+    idx = len(coefficients) - 1
+    result = coefficients[idx]
+    while idx > 0:
+        idx -= 1
+        result = coefficients[idx] + (result * x)
 
     return result
 
@@ -35,12 +42,52 @@ def linear_interp_in_parts(x: float, known_points: list[tuple[float, float]], ex
         elif x > max_x:
             return max_y
 
-    for segment_idx in range(len(known_points) - 1):
-        x1, y1 = known_points[segment_idx]
-        x2, y2 = known_points[segment_idx + 1]
-        if x < x1 or x > x2: continue
+    if x < min_x or x > max_x:
+        raise ValueError("Input value out of bounds")
+
+    # Binary search for the first segment [lo, lo + 1] with x1 <= x <= x2, so that `x` on a known point
+    # uses the segment ending there, like a scan from the left would.
+    lo = 0
+    hi = len(known_points) - 1
+    while (hi - lo) > 1:
+        mid = (lo + hi) // 2
+        if known_points[mid][0] < x:
+            lo = mid
+        else:
+            hi = mid
+
+    x1, y1 = known_points[lo]
+    x2, y2 = known_points[hi]
+    slope = (y2 - y1) / (x2 - x1)
+    return y1 + (slope * (x - x1))
+
+def linear_interp_xy(x: float, xs, ys, extrapolate_edges: bool=True) -> float:
+    """Same as `linear_interp_in_parts`, but with the known points given as parallel `xs` and `ys` sequences.
+
+    Any indexable sequence works (e.g. `array.array`), which avoids one tuple per point. The segment is
+    found by binary search over `xs`.
+    """
+
+    num_points = len(xs)
+    if num_points < 2 or len(ys) != num_points:
+        raise ValueError("Insufficient known points for interpolation")
+
+    if x < xs[0] or x > xs[-1]:
+        if not extrapolate_edges:
+            raise ValueError("Input value out of bounds")
+        return ys[0] if x < xs[0] else ys[-1]
 
-        slope = (y2 - y1) / (x2 - x1)
-        return y1 + (slope * (x - x1))
+    # Find the segment [lo, lo + 1] such that xs[lo] <= x <= xs[lo + 1]
+    lo = 0
+    hi = num_points - 1
+    while (hi - lo) > 1:
+        mid = (lo + hi) // 2
+        if x < xs[mid]:
+            hi = mid
+        else:
+            lo = mid
 
-    raise ValueError("Input value out of bounds")
+    x1 = xs[lo]
+    y1 = ys[lo]
+    slope = (ys[hi] - y1) / (xs[hi] - x1)
+    return y1 + (slope * (x - x1))
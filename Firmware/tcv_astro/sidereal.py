@@ -1,20 +1,33 @@
-from tcv_astro.polynomial import poly_eval
 from tcv_astro.ecliptic import nutations_and_obliquity
 from tcv_astro.julian import julian_day_to_julian_centuries
 from tcv_astro.angles import cos_degrees
+from tcv_astro.utils import cache_jd_key, bounded_cache_put, JD_CACHE_SIZE
+
+_sidereal_time_cache: dict = {}
+
+# Coefficients in T of the mean sidereal time, see poly_eval()
+_THETA_O_COEFFS = (100.46061837, 36000.770053608, 0.000387933, -1.0 / 38710000.0)
 
 
 def sidereal_time_at_greenwhich(jd: float) -> float:
     """Get sidereal time at Greenwhich. Assumes 0h UT.
 
+    Results are cached.
+
      Reference:
         Meeus, J. (1991). Astronomical algorithms (1st ed.). Willmann-Bell". Chapter 11.
 
     """
+    key = cache_jd_key(jd)
+    theta_o_app = _sidereal_time_cache.get(key)
+    if theta_o_app is not None:
+        return theta_o_app
+
     T = julian_day_to_julian_centuries(jd)
 
     # Mean sidereal time
-    theta_o = poly_eval(T, [100.46061837, 36000.770053608, 0.000387933, -1.0 / 38710000.0]) % 360.0
+    c0, c1, c2, c3 = _THETA_O_COEFFS
+    theta_o = (c0 + ((c1 + ((c2 + (c3 * T)) * T)) * T)) % 360.0
 
     nutations = nutations_and_obliquity(jd)
     # TODO: use more accurate nutations algorithm
@@ -25,4 +38,5 @@ def sidereal_time_at_greenwhich(jd: float) -> float:
 
     # print(locals())
 
+    bounded_cache_put(_sidereal_time_cache, key, theta_o_app, JD_CACHE_SIZE)
     return theta_o_app
\ No newline at end of file
@@ -1,7 +1,13 @@
 from tcv_astro import julian
-from tcv_astro.polynomial import poly_eval
-from tcv_astro.angles import sin_degrees, cos_degrees, asin_degrees, atan2_degrees, degrees_to_hms, degrees_to_dms
-from tcv_astro.ecliptic import nutation_simplified_meeus
+from tcv_astro.angles import sin_degrees, cos_degrees, sincos_degrees, asin_degrees, atan2_degrees, degrees_to_hms, degrees_to_dms
+from tcv_astro.ecliptic import nutations_and_obliquity
+from tcv_astro.utils import cache_jd_key, bounded_cache_put, JD_CACHE_SIZE
+
+# Coefficients in T of the polynomials in solar_coordinates_low_accuracy_meeus(), see poly_eval()
+_LO_COEFFS = (280.46645, 36000.76983, 0.0003032)
+_M_COEFFS = (357.52910, 35999.05030, -0.0001559, -0.00000048)
+_E_COEFFS = (0.016708617, -0.000042037, -0.0000001236)
+_C_SIN_M_COEFFS = (1.914600, -0.004817, -0.000014)
 
 
 class SolarCoordinates:
@@ -42,19 +48,23 @@ def solar_coordinates_low_accuracy_meeus(jd: float) -> SolarCoordinates:
     T = julian.julian_day_to_julian_centuries(jd, epoch=julian.EPOCH_J2000)
 
     # Geometric mean longitude of the Sun
-    Lo = poly_eval(T, [280.46645, 36000.76983, 0.0003032]) % 360.0
+    c0, c1, c2 = _LO_COEFFS
+    Lo = (c0 + ((c1 + (c2 * T)) * T)) % 360.0
 
     # Mean anomaly of the Sun
-    M = poly_eval(T, [357.52910, 35999.05030, -0.0001559, -0.00000048]) % 360.0
+    c0, c1, c2, c3 = _M_COEFFS
+    M = (c0 + ((c1 + ((c2 + (c3 * T)) * T)) * T)) % 360.0
 
     # Eccentricity of the Earth/Sun orbit
 
     # Value 1: "Meeus, J. (1991). Astronomical algorithms (1st ed.). Willmann-Bell". Equation 24.4.
-    e = poly_eval(T, [0.016708617, -0.000042037, -0.0000001236])
+    c0, c1, c2 = _E_COEFFS
+    e = c0 + ((c1 + (c2 * T)) * T)
 
     # Equation of the center, estimatd in parts
-    CsinM = poly_eval(T, [1.914600, -0.004817, -0.000014]) * sin_degrees(M)
-    Csin2M = poly_eval(T, [0.019993, -0.000101]) * sin_degrees((2.0 * M) % 360.0)
+    c0, c1, c2 = _C_SIN_M_COEFFS
+    CsinM = (c0 + ((c1 + (c2 * T)) * T)) * sin_degrees(M)
+    Csin2M = (0.019993 + (-0.000101 * T)) * sin_degrees((2.0 * M) % 360.0)
     Csin3M = 0.000290 * sin_degrees((3.0 * M) % 360.0)
     C = CsinM + Csin2M + Csin3M
 
@@ -68,22 +78,35 @@ def solar_coordinates_low_accuracy_meeus(jd: float) -> SolarCoordinates:
     R = (1.000001018 * (1.0 - (e * e))) / (1.0 + (e * cos_degrees(v % 360.0)))
 
     # Apparent longitude
-    Omega = poly_eval(T, [125.04, -1934.136]) % 360.0
-    sun_lambda = (Theta - 0.00569 - (0.00478 * sin_degrees(Omega))) % 360.0
+    Omega = (125.04 + (-1934.136 * T)) % 360.0
+    sin_Omega, cos_Omega = sincos_degrees(Omega)
+    sun_lambda = (Theta - 0.00569 - (0.00478 * sin_Omega)) % 360.0
 
     # Compute true obliquity
-    epsilon = nutation_simplified_meeus(jd).true_obliquity
+    epsilon = nutations_and_obliquity(jd).true_obliquity
 
     # Compute right ascension and declination
-    ra = atan2_degrees((cos_degrees(epsilon) * sin_degrees(Theta)), cos_degrees(Theta)) % 360.0
-    dec = asin_degrees(sin_degrees(epsilon) * sin_degrees(Theta))
+    sin_epsilon, cos_epsilon = sincos_degrees(epsilon)
+    sin_Theta, cos_Theta = sincos_degrees(Theta)
+    ra = atan2_degrees((cos_epsilon * sin_Theta), cos_Theta) % 360.0
+    dec = asin_degrees(sin_epsilon * sin_Theta)
 
     # Compute apparent right ascension and declination
-    epsilon_for_apparent = epsilon + (0.00256 * cos_degrees(Omega))
-    ra_apparent = atan2_degrees((cos_degrees(epsilon_for_apparent) * sin_degrees(sun_lambda)), cos_degrees(sun_lambda)) % 360.0
-    dec_apparent = asin_degrees(sin_degrees(epsilon_for_apparent) * sin_degrees(sun_lambda))
+    sin_epsilon_app, cos_epsilon_app = sincos_degrees(epsilon + (0.00256 * cos_Omega))
+    sin_lambda, cos_lambda = sincos_degrees(sun_lambda)
+    ra_apparent = atan2_degrees((cos_epsilon_app * sin_lambda), cos_lambda) % 360.0
+    dec_apparent = asin_degrees(sin_epsilon_app * sin_lambda)
 
     return SolarCoordinates(true_lon=Theta, apparent_lon=sun_lambda, apparent_lat=0.0, radius_vector=R, ra=ra, dec=dec, ra_apparent=ra_apparent, dec_apparent=dec_apparent)
 
+_solar_coordinates_cache: dict = {}
+
+
 def solar_coordinates(jd: float) -> SolarCoordinates:
-    return solar_coordinates_low_accuracy_meeus(jd)
+    """Same as solar_coordinates_low_accuracy_meeus(), cached."""
+    key = cache_jd_key(jd)
+    coordinates = _solar_coordinates_cache.get(key)
+    if coordinates is None:
+        coordinates = solar_coordinates_low_accuracy_meeus(jd)
+        bounded_cache_put(_solar_coordinates_cache, key, coordinates, JD_CACHE_SIZE)
+    return coordinates
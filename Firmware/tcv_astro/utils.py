@@ -6,9 +6,33 @@ def package_relpath(module_path: str, filename: str):
 
     Done so that it works both with `/` and `\\` separators portably.
     """
-    for sep in ['/', '\\']:
+    for sep in ('/', '\\'):
         last_sep_idx = module_path.rfind(sep)
         if last_sep_idx != -1:
             return module_path[:last_sep_idx] + sep + filename
 
-    return filename
\ No newline at end of file
+    return filename
+
+def cache_jd_key(jd: float) -> float:
+    """Key for caching results by Julian day `jd`.
+
+    Rounded to ~0.1s so that the same day reached by different arithmetic (e.g. `jd + 1.0` vs. converting
+    the next date) still hits the cache.
+    """
+    return round(jd, 6)
+
+
+# Entries kept by the per-day caches of coordinates and sidereal times. Rise/set times for a day and for the
+# next one need positions from the day before through the day after each, so both fit with room to spare.
+JD_CACHE_SIZE = 6
+
+
+def bounded_cache_put(cache: dict, key, value, max_entries: int) -> None:
+    """Store `value` under `key` in `cache`, evicting the smallest keys to hold at most `max_entries`.
+
+    With Julian day keys, this drops the days furthest in the past. Insertion order can't be used for this,
+    since MicroPython dicts don't keep it.
+    """
+    while len(cache) >= max_entries:
+        del cache[min(cache)]
+    cache[key] = value
@@ -9,6 +9,7 @@ class TestAngles(unittest.TestCase):
         self.assertEqual(angles.signum(0.0), 1.0)
         self.assertEqual(angles.signum(-0.0001), -1.0)
         self.assertEqual(angles.signum(-1000.0), -1.0)
+        self.assertEqual(angles.signum(-0.0), -1.0)
 
     def test_dms_conversion(self):
         self.assertAlmostEqual(angles.dms_to_degrees(150.0, 0.0, 0.0), 150.0)
@@ -19,6 +20,13 @@ class TestAngles(unittest.TestCase):
         self.assertAlmostEqual(angles.dms_to_degrees(-150.0, 30.0, 0.0), -150.5)
         self.assertAlmostEqual(angles.dms_to_degrees(-150.0, 30.0, 3600.0), -151.5)
         self.assertAlmostEqual(angles.dms_to_degrees(0, 0.0, 1.0), 1.0/3600.0)
+        self.assertAlmostEqual(angles.dms_to_degrees(-0.0, 30.0, 0.0), -0.5)
+
+    def test_trig_needs_no_modulo(self):
+        # Table 45 arguments are passed to sin/cos without reducing them to [0, 360) first.
+        for degrees in (-1440.5, -361.0, 721.25, 1234.5678, 123456.789, 98765432.1):
+            self.assertAlmostEqual(angles.sin_degrees(degrees), angles.sin_degrees(degrees % 360.0), places=9)
+            self.assertAlmostEqual(angles.cos_degrees(degrees), angles.cos_degrees(degrees % 360.0), places=9)
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,7 +2,7 @@ import unittest
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
-from tcv_astro.event_times import get_event_time, RiseTransitSetTimes, ObjectPositions, get_moon_positions_for_event, get_sun_positions_for_event
+from tcv_astro.event_times import get_event_time, RiseTransitSetTimes, ObjectPositions, get_moon_positions_for_event, get_sun_positions_for_event, get_moon_positions_window, get_sun_positions_window
 from tcv_astro.julian import date_to_julian_day
 from tcv_astro.angles import hours_to_hms
 
@@ -229,6 +229,25 @@ class TestEventTimes(unittest.TestCase):
         # 2025 Feb 09 (Sun)        19:28  51        02:44 75S        11:02 310
         # 2025 Feb 10 (Mon)        20:40  56        03:42 72S        11:44 306
         # """
+    def test_positions_window_matches_single_day(self):
+        jd = date_to_julian_day(2025, 3, 25)
+
+        windows = [
+            (get_sun_positions_window(jd), get_sun_positions_for_event),
+            (get_moon_positions_window(jd), get_moon_positions_for_event),
+        ]
+        for window, single_day in windows:
+            # Window positions are computed lazily in any order, including before `jd`
+            for day in (0, 1, 2, -1):
+                positions = window.positions(day)
+                expected = single_day(jd + day)
+                self.assertEqual(positions.prev_day_ra_apparent, expected.prev_day_ra_apparent)
+                self.assertEqual(positions.prev_day_dec_apparent, expected.prev_day_dec_apparent)
+                self.assertEqual(positions.cur_day_ra_apparent, expected.cur_day_ra_apparent)
+                self.assertEqual(positions.cur_day_dec_apparent, expected.cur_day_dec_apparent)
+                self.assertEqual(positions.next_day_ra_apparent, expected.next_day_ra_apparent)
+                self.assertEqual(positions.next_day_dec_apparent, expected.next_day_dec_apparent)
+                self.assertEqual(positions.ho_degrees, expected.ho_degrees)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,6 +1,7 @@
 import unittest
 
 from tcv_astro import moon
+from tcv_astro import julian
 
 class TestMoon(unittest.TestCase):
     def test_lunar_coordinates(self):
@@ -14,5 +15,14 @@ class TestMoon(unittest.TestCase):
         # self.assertAlmostEqual(position.ra_apparent, 198.38082, places=3)
         # self.assertAlmostEqual(position.dec_apparent, -7.78507, places=3)
 
+    def test_lunar_age_normalized(self):
+        # First quarter on 2025 April 5, 02:15 UTC
+        jd = julian.date_to_julian_day(2025, 4, 5) + julian.time_to_fraction(2, 15, 20)
+        age = moon.lunar_age_normalized_28_days(jd)
+        self.assertAlmostEqual(age, 7.0, places=2)
+
+        # Advances by about 28 / 29.53 normalized days per day
+        self.assertAlmostEqual(moon.lunar_age_normalized_28_days(jd + 1.0) - age, 28.0 / 29.530575, places=1)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,37 @@
+import unittest
+
+from packed_bitmap_font import PackedBitmapFont, load_packed_font
+from utils.pack_bdf_font import parse_bdf, pack_font
+
+BDF_FILE = "fonts/moonclock.bdf"
+PACKED_FILE = "fonts/moonclock.bin"
+
+class TestPackedFont(unittest.TestCase):
+    def test_packed_font_matches_bdf(self):
+        with open(BDF_FILE, "r") as infile:
+            bounding_box, bdf_glyphs = parse_bdf(infile.read())
+
+        font = PackedBitmapFont(pack_font(bounding_box, bdf_glyphs))
+        self.assertEqual(font.get_bounding_box(), bounding_box)
+
+        for code_point, bdf_glyph in bdf_glyphs.items():
+            glyph = font.get_glyph(code_point)
+            self.assertEqual((glyph.width, glyph.height, glyph.dx, glyph.dy, glyph.shift_x), (bdf_glyph.width, bdf_glyph.height, bdf_glyph.dx, bdf_glyph.dy, bdf_glyph.shift_x))
+            for y, row in enumerate(bdf_glyph.rows):
+                for x in range(bdf_glyph.width):
+                    self.assertEqual(glyph.bitmap[x, y], (row[x // 8] >> (7 - (x % 8))) & 1)
+
+        self.assertIsNone(font.get_glyph(min(bdf_glyphs) - 1))
+        self.assertIsNone(font.get_glyph(max(bdf_glyphs) + 1))
+
+    def test_packed_font_file_is_up_to_date(self):
+        with open(BDF_FILE, "r") as infile:
+            bounding_box, bdf_glyphs = parse_bdf(infile.read())
+
+        with open(PACKED_FILE, "rb") as infile:
+            self.assertEqual(infile.read(), pack_font(bounding_box, bdf_glyphs), "Regenerate %s with utils/pack_bdf_font.py" % PACKED_FILE)
+
+        self.assertEqual(load_packed_font(PACKED_FILE).get_bounding_box(), bounding_box)
+
+if __name__ == '__main__':
+    unittest.main()
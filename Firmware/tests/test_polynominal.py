@@ -48,6 +48,42 @@ class TestPolynomial(unittest.TestCase):
         self.assertEqual(polynomial.linear_interp_in_parts(x=2.0, known_points=coeffs), 3.0)
         self.assertEqual(polynomial.linear_interp_in_parts(x=2.5, known_points=coeffs), 4.0)
 
+    def test_linear_interpolate_xy(self):
+        xs = [1.0, 2.0, 3.0]
+        ys = [2.0, 3.0, 5.0]
+
+        with self.assertRaises(ValueError):
+            polynomial.linear_interp_xy(x=0.0, xs=[], ys=[])
+        with self.assertRaises(ValueError):
+            polynomial.linear_interp_xy(x=0.0, xs=[1.0], ys=[2.0])
+        with self.assertRaises(ValueError):
+            polynomial.linear_interp_xy(x=0.0, xs=xs, ys=ys[:2])
+
+        # Edge conditions without extrapolation
+        with self.assertRaises(ValueError):
+            polynomial.linear_interp_xy(x=0.0, xs=xs, ys=ys, extrapolate_edges=False)
+        with self.assertRaises(ValueError):
+            polynomial.linear_interp_xy(x=4.0, xs=xs, ys=ys, extrapolate_edges=False)
+
+        # Edge conditions with extrapolation
+        self.assertEqual(polynomial.linear_interp_xy(x=1.0, xs=xs, ys=ys), 2.0)
+        self.assertEqual(polynomial.linear_interp_xy(x=-1000.0, xs=xs, ys=ys), 2.0)
+        self.assertEqual(polynomial.linear_interp_xy(x=3.0, xs=xs, ys=ys), 5.0)
+        self.assertEqual(polynomial.linear_interp_xy(x=1000.0, xs=xs, ys=ys), 5.0)
+
+        # Intermediate values
+        self.assertEqual(polynomial.linear_interp_xy(x=1.5, xs=xs, ys=ys), 2.5)
+        self.assertEqual(polynomial.linear_interp_xy(x=2.0, xs=xs, ys=ys), 3.0)
+        self.assertEqual(polynomial.linear_interp_xy(x=2.5, xs=xs, ys=ys), 4.0)
+
+        # Matches the tuple-based version
+        points = [(0.0, 410), (0.25, 610), (0.5, 800), (1.0, 1000), (1.5, 1180)]
+        point_xs = [point[0] for point in points]
+        point_ys = [point[1] for point in points]
+        for step in range(-2, 34):
+            x = step * 0.05
+            self.assertAlmostEqual(polynomial.linear_interp_xy(x, point_xs, point_ys), polynomial.linear_interp_in_parts(x, points))
+
     
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,6 +1,7 @@
 import unittest
 
 from tcv_astro import sun
+from tcv_astro.utils import JD_CACHE_SIZE
 
 class TestSun(unittest.TestCase):
     def test_solar_coordinates(self):
@@ -14,5 +15,24 @@ class TestSun(unittest.TestCase):
         self.assertAlmostEqual(position.ra_apparent, 198.38082, places=3)
         self.assertAlmostEqual(position.dec_apparent, -7.78507, places=3)
 
+    def test_solar_coordinates_cached(self):
+        jd = 2448908.5
+        position = sun.solar_coordinates(jd)
+        expected = sun.solar_coordinates_low_accuracy_meeus(jd)
+
+        self.assertEqual(position.ra_apparent, expected.ra_apparent)
+        self.assertEqual(position.dec_apparent, expected.dec_apparent)
+        # Same day reached through different arithmetic is served from the cache
+        self.assertIs(sun.solar_coordinates((jd - 1.0) + 1.0), position)
+
+        # Walking forward through days evicts earlier ones: results and repeated calls stay correct, including
+        # for the first day when it is looked up again at the end.
+        for day in list(range(2 * JD_CACHE_SIZE)) + [0]:
+            position = sun.solar_coordinates(jd + day)
+            expected = sun.solar_coordinates_low_accuracy_meeus(jd + day)
+            self.assertEqual(position.ra_apparent, expected.ra_apparent)
+            self.assertEqual(position.dec_apparent, expected.dec_apparent)
+            self.assertEqual(sun.solar_coordinates(jd + day).true_lon, expected.true_lon)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
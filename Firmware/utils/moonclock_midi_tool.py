@@ -5,6 +5,20 @@ import re
 
 from dataclasses import dataclass, field
 
+# Examples to try: 31:22:33, 1:22:34, 01:22:34, 01:22:60, 11:22, 11:22:33, 11:22:3, 11:22:03, 23:59:59
+_UTC_TIME_REGEX = re.compile(r'^((?P<hours>20|21|23|1[0-9]|0[0-9]|[0-9])(:(?P<minutes>[0-5][0-9])(:(?P<seconds>([0-5][0-9])?))?)|now)$')
+
+# Examples to try: -1, -01, -02:00, -02:30, +02:30, +2:30, +2
+_UTC_OFFSET_REGEX = re.compile(r'^(?P<hours>[-+](20|21|23|1[0-9]|0[0-9]|[0-9]))(:(?P<minutes>[0-5][0-9]))?$')
+
+# Examples to try: now, 2025/01/2, 2025/1/22, 2025/01/22, 2025/01/1, 2025/01/11, 2025/01/31, 2025/01/32, 2025/01/29, 2025/01/20, 2025/01/19, 2025/01/10, 2025/01/09, 2025/01/9, 2025/1/1, 2025/01/0, 2025/01/00, 2025/0/11, 2025/13/11
+_DATE_REGEX = re.compile(r'^((?P<year>20[0-9]{2})/(?P<month>10|11|12|0?[1-9])/(?P<day>30|31|([12][0-9])|(0?[1-9]))|now)$')
+
+_CALIBRATION_REGEX = re.compile(r'^(?P<channel>\d+):(?P<value>\d+)$')
+
+# Indexed by datetime.date.weekday()
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
 @dataclass
 class ToolOptions:
     verbose_logs: bool = False
@@ -46,7 +60,7 @@ class ToolContext:
     def send_midi_sysex_string(self, command: str) -> None:
         # All commands are just ASCII 0-127 commands sent as a block to the overall sysex with no manufacturer ID.
         # This is because the Moon Clock is alone by USB midi, so we cannot clash.
-        self.midi_out_port.send(mido.Message('sysex', data=[ord(c) for c in command]))
+        self.midi_out_port.send(mido.Message('sysex', data=command.encode('ascii')))
 
 
 class Action:
@@ -66,19 +80,7 @@ class SetUtcTimeAction:
 
     @staticmethod
     def build(arg: str) -> Action:
-        TEST_VALUES = """
-            31:22:33
-            1:22:34
-            01:22:34
-            01:22:60
-            11:22
-            11:22:33
-            11:22:3
-            11:22:03
-            23:59:59
-        """
-        time_regex = re.compile(r'^((?P<hours>20|21|23|1[0-9]|0[0-9]|[0-9])(:(?P<minutes>[0-5][0-9])(:(?P<seconds>([0-5][0-9])?))?)|now)$')
-        match = time_regex.match(arg)
+        match = _UTC_TIME_REGEX.match(arg)
         if not match:
             raise ValueError('Wrong UTC time format')
 
@@ -106,18 +108,7 @@ class SetUtcOffsetAction:
 
     @staticmethod
     def build(arg: str) -> Action:
-        TEST_VALUES = """
-            -1
-            -01
-            -02:00
-            -02:30
-            +02:30
-            +2:30
-            +2
-        """
-        time_regex = re.compile(r'^(?P<hours>[-+](20|21|23|1[0-9]|0[0-9]|[0-9]))(:(?P<minutes>[0-5][0-9]))?$')
-
-        match = time_regex.match(arg)
+        match = _UTC_OFFSET_REGEX.match(arg)
         if not match:
             raise ValueError('Wrong timezone offset')
 
@@ -138,41 +129,12 @@ class SetDateAction:
         self.dow = dow
 
     def execute(self, context: ToolContext):
-        DAY_NAMES = {
-            0: "Monday", 1: "Tuesday", 2: "Wednesday", 3: "Thursday", 4: "Friday", 5: "Saturday", 6: "Sunday"
-        }
-        print(f"ACTION: Setting date to {self.year:04d}/{self.month:02d}/{self.day:02d} ({DAY_NAMES[self.dow]})")
+        print(f"ACTION: Setting date to {self.year:04d}/{self.month:02d}/{self.day:02d} ({_DAY_NAMES[self.dow]})")
         context.command_sender.send_set_date(self.year, self.month, self.day, self.dow)
 
     @staticmethod
     def build(arg: str) -> Action:
-        TEST_VALUES = """
-            now
-            2025/01/2
-            2025/1/22
-            2025/01/22
-            2025/01/1
-            2025/01/11
-            2025/01/31
-            2025/01/32
-            2025/01/29
-            2025/01/20
-            2025/01/19
-            2025/01/10
-            2025/01/09
-            2025/01/9
-            2025/01/1
-            2025/1/1
-            2025/01/0
-            2025/01/00
-            2025/01/00
-            2025/0/11
-            2025/13/11
-            2025/01/0
-            2025/01/0
-        """
-        time_regex = re.compile(r'^((?P<year>20[0-9]{2})/(?P<month>10|11|12|0?[1-9])/(?P<day>30|31|([12][0-9])|(0?[1-9]))|now)$')
-        match = time_regex.match(arg)
+        match = _DATE_REGEX.match(arg)
         if not match:
             raise ValueError('Wrong date format (expect YYYY/MM/DD or "now")')
 
@@ -220,8 +182,7 @@ class CalibrateAction:
     @staticmethod
     def build(arg: str) -> Action:
         try:
-            cal_regex = re.compile(r'^(?P<channel>\d+):(?P<value>\d+)$')
-            match = cal_regex.match(arg)
+            match = _CALIBRATION_REGEX.match(arg)
             if not match:
                 raise ValueError('Wrong calibration argument format')
 
@@ -252,19 +213,22 @@ class CommandLine:
     actions: list[Action] = field(default_factory=list)
 
 
-def is_likely_usable_port(name: str) -> bool:
-    if "CircuitPython" in name:
-        return True
-    elif "MoonClock" in name:
-        return True
+# Substrings of the MIDI port names under which a MoonClock shows up
+_USABLE_PORT_TOKENS = ("CircuitPython", "MoonClock")
+
 
-    return False
+def is_likely_usable_port(name: str) -> bool:
+    return any(token in name for token in _USABLE_PORT_TOKENS)
 
 
 def get_usable_midi_outs() -> list[str]:
     return [name for name in mido.get_output_names() if is_likely_usable_port(name)]
 
 
+# Single-valued action arguments, in the order their actions get executed.
+_ORDERED_ACTION_ATTRS = ("set_utc_time", "set_utc_offset", "set_date", "set_dst")
+
+
 def parse_command_line() -> CommandLine:
     options = ToolOptions()
     actions: list[Action] = []
@@ -292,17 +256,12 @@ def parse_command_line() -> CommandLine:
     if args.verbose:
         options.verbose_logs = True
 
-    if args.set_utc_time:
-        actions.append(args.set_utc_time)
-    if args.set_utc_offset:
-        actions.append(args.set_utc_offset)
-    if args.set_date:
-        actions.append(args.set_date)
-    if args.set_dst:
-        actions.append(args.set_dst)
+    for attr_name in _ORDERED_ACTION_ATTRS:
+        action = getattr(args, attr_name)
+        if action:
+            actions.append(action)
     if args.cal:
-        for cal_action in args.cal:
-            actions.append(cal_action)
+        actions.extend(args.cal)
     if args.stop_cal:
         actions.append(StopCalibrateAction())
 
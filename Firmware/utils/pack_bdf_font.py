@@ -0,0 +1,103 @@
+"""Convert a BDF font to the packed format read by packed_bitmap_font.py on the MoonClock.
+
+Usage: python utils/pack_bdf_font.py fonts/moonclock.bdf fonts/moonclock.bin
+"""
+import argparse
+import os
+import struct
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from packed_bitmap_font import PACKED_FONT_MAGIC, HEADER_FORMAT, GLYPH_FORMAT, MISSING_GLYPH_WIDTH
+
+
+class BdfGlyph:
+    def __init__(self, width: int, height: int, dx: int, dy: int, shift_x: int, rows: list[bytes]):
+        self.width = width
+        self.height = height
+        self.dx = dx
+        self.dy = dy
+        self.shift_x = shift_x
+        # One entry per bitmap row, top row first, leftmost pixel in the MSB of the first byte
+        self.rows = rows
+
+
+def parse_bdf(bdf_text: str) -> tuple[tuple[int, int, int, int], dict[int, BdfGlyph]]:
+    """Return (FONTBOUNDINGBOX, {codepoint: glyph}) for the BDF font in `bdf_text`."""
+    bounding_box = None
+    glyphs = {}
+
+    code_point = None
+    shift_x = 0
+    bbx = None
+    rows = None
+
+    for line in bdf_text.splitlines():
+        fields = line.split()
+        if not fields:
+            continue
+        keyword = fields[0]
+
+        if rows is not None:
+            if keyword == "ENDCHAR":
+                width, height, dx, dy = bbx
+                row_bytes = (width + 7) // 8
+                glyphs[code_point] = BdfGlyph(width, height, dx, dy, shift_x, [bytes.fromhex(row)[:row_bytes] for row in rows])
+                rows = None
+            else:
+                rows.append(keyword)
+        elif keyword == "FONTBOUNDINGBOX":
+            bounding_box = tuple(int(value) for value in fields[1:5])
+        elif keyword == "ENCODING":
+            code_point = int(fields[1])
+        elif keyword == "DWIDTH":
+            shift_x = int(fields[1])
+        elif keyword == "BBX":
+            bbx = tuple(int(value) for value in fields[1:5])
+        elif keyword == "BITMAP":
+            rows = []
+
+    if bounding_box is None:
+        raise ValueError("No FONTBOUNDINGBOX in BDF font")
+
+    return bounding_box, glyphs
+
+
+def pack_font(bounding_box: tuple[int, int, int, int], glyphs: dict[int, BdfGlyph]) -> bytes:
+    first_code = min(glyphs)
+    num_glyphs = max(glyphs) - first_code + 1
+
+    records = bytearray()
+    bitmaps = bytearray()
+    for code_point in range(first_code, first_code + num_glyphs):
+        glyph = glyphs.get(code_point)
+        if glyph is None:
+            records += struct.pack(GLYPH_FORMAT, MISSING_GLYPH_WIDTH, 0, 0, 0, 0, 0)
+            continue
+
+        records += struct.pack(GLYPH_FORMAT, glyph.width, glyph.height, glyph.dx, glyph.dy, glyph.shift_x, len(bitmaps))
+        for row in glyph.rows:
+            bitmaps += row
+
+    header = struct.pack(HEADER_FORMAT, PACKED_FONT_MAGIC, *bounding_box, first_code, num_glyphs)
+    return bytes(header + records + bitmaps)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack a BDF font for the MoonClock firmware")
+    parser.add_argument("bdf_file", help="Input BDF font")
+    parser.add_argument("packed_file", help="Output packed font")
+    args = parser.parse_args()
+
+    with open(args.bdf_file, "r") as infile:
+        bounding_box, glyphs = parse_bdf(infile.read())
+
+    packed = pack_font(bounding_box, glyphs)
+    with open(args.packed_file, "wb") as outfile:
+        outfile.write(packed)
+
+    print(f"Packed {len(glyphs)} glyphs into {len(packed)} bytes")
+
+
+if __name__ == "__main__":
+    main()